@@ -10,6 +10,8 @@
 # Date: 19/02/2018.
 
 # 1) Inherit inhouse modifications. Package: MyBio.
+# 2) Replace the removed Bio.KDTree module with scipy.spatial.cKDTree.
+# 3) Included function search_batch.
 
 # Each line or block with modifications contain a MODBY tag.
 
@@ -22,7 +24,10 @@ from __future__ import print_function
 
 import numpy
 
-from Bio.KDTree import KDTree
+# MODBY: Alexandre Fassio
+# Bio.KDTree was deprecated and removed from Biopython. Use SciPy's KD tree,
+# which also supports batch queries.
+from scipy.spatial import cKDTree
 
 # MODBY: Alexandre Fassio
 # Inherit inhouse modifications. Package: MyBio.
@@ -40,7 +45,8 @@ class NeighborSearch(object):
      2. To find all atoms/residues/chains/models/structures that are within
         a fixed radius of each other.
 
-    NeighborSearch makes use of the Bio.KDTree C++ module, so it's fast.
+    NeighborSearch makes use of the scipy.spatial.cKDTree C++ module,
+    so it's fast.
     """
 
     def __init__(self, atom_list, bucket_size=10):
@@ -60,8 +66,11 @@ class NeighborSearch(object):
         self.coords = numpy.array(coord_list).astype("f")
         assert(bucket_size > 1)
         assert(self.coords.shape[1] == 3)
-        self.kdt = KDTree(3, bucket_size)
-        self.kdt.set_coords(self.coords)
+        # MODBY: Alexandre Fassio
+        # Use SciPy's KD tree instead of Bio.KDTree.
+        self.kdt = cKDTree(self.coords, leafsize=bucket_size)
+        # Parent entity of each atom by entity level, computed on demand.
+        self._parents_by_level = {}
 
     # Private
 
@@ -83,6 +92,14 @@ class NeighborSearch(object):
                 parent_pair_list.append((p2, p1))
         return uniqueify(parent_pair_list)
 
+    # MODBY: Alexandre Fassio
+    # Map atom indices to their parent entities at a given level.
+    def _get_parents(self, level):
+        if level not in self._parents_by_level:
+            self._parents_by_level[level] = \
+                [a.get_parent_by_level(level) for a in self.atom_list]
+        return self._parents_by_level[level]
+
     # Public
 
     def search(self, center, radius, level="A"):
@@ -102,18 +119,44 @@ class NeighborSearch(object):
         """
         if level not in entity_levels:
             raise PDBException("%s: Unknown level" % level)
-        self.kdt.search(center, radius)
-        indices = self.kdt.get_indices()
-        n_atom_list = []
+        # MODBY: Alexandre Fassio
+        # Query SciPy's KD tree.
+        indices = self.kdt.query_ball_point(center, radius)
         atom_list = self.atom_list
-        for i in indices:
-            a = atom_list[i]
-            n_atom_list.append(a)
+        n_atom_list = [atom_list[i] for i in indices]
         if level == "A":
             return n_atom_list
         else:
             return unfold_entities(n_atom_list, level)
 
+    # MODBY: Alexandre Fassio
+    # Search the neighbors of several positions with a single query.
+    def search_batch(self, centers, radius, level="A"):
+        """Neighbor search for multiple query positions at once.
+
+        Return, for each center, all atoms/residues/chains/models/structures
+        that have at least one atom within radius of it. The KD tree is
+        queried only once, which is much faster than calling
+        :meth:`search` for each center.
+
+        Arguments:
+         - centers - Nx3 Numeric array
+         - radius - float
+         - level - char (A, R, C, M, S)
+
+        """
+        if level not in entity_levels:
+            raise PDBException("%s: Unknown level" % level)
+        centers = numpy.asarray(centers).reshape(-1, 3)
+        indices_list = self.kdt.query_ball_point(centers, radius)
+        if level == "A":
+            parents = self.atom_list
+        else:
+            parents = self._get_parents(level)
+        # dict.fromkeys() removes duplicates and preserves the order.
+        return [list(dict.fromkeys(parents[i] for i in indices))
+                for indices in indices_list]
+
     def search_all(self, radius, level="A"):
         """All neighbor search.
 
@@ -127,8 +170,9 @@ class NeighborSearch(object):
         """
         if level not in entity_levels:
             raise PDBException("%s: Unknown level" % level)
-        self.kdt.all_search(radius)
-        indices = self.kdt.all_get_indices()
+        # MODBY: Alexandre Fassio
+        # Query SciPy's KD tree.
+        indices = self.kdt.query_pairs(radius, output_type="ndarray")
         atom_list = self.atom_list
         atom_pair_list = []
         for i1, i2 in indices:
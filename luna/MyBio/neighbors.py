@@ -22,6 +22,15 @@ class Neighbors:
         return self.successor is not None
 
 
+def _atom_name_map(residue, select):
+    """Map atom names to atoms in ``residue`` accepted by ``select``."""
+    # The default selection accepts every atom, so skip the predicate call.
+    if type(select) is Select:
+        return {atm.name: atm for atm in residue.get_atoms()}
+    return {atm.name: atm for atm in residue.get_atoms()
+            if select.accept_atom(atm)}
+
+
 def get_residue_neighbors(residue, select=Select(), verbose=True):
     """Get all neighbors from a residue.
 
@@ -46,8 +55,7 @@ def get_residue_neighbors(residue, select=Select(), verbose=True):
     """
 
     # Get valid atoms according to the provided selection function.
-    trgt_res_atms = {atm.name: atm for atm in residue.get_atoms()
-                     if select.accept_atom(atm)}
+    trgt_res_atms = _atom_name_map(residue, select)
 
     if residue.is_residue():
         if "N" not in trgt_res_atms and verbose:
@@ -71,8 +79,7 @@ def get_residue_neighbors(residue, select=Select(), verbose=True):
             # First residue before the target in the chain list.
             prev_res = residue.parent.child_list[residue.idx - 1]
             # Get valid atoms according to the provided selection function.
-            prev_res_atms = {atm.name: atm for atm in prev_res.get_atoms()
-                             if select.accept_atom(atm)}
+            prev_res_atms = _atom_name_map(prev_res, select)
 
             # A peptide bond exists between the C of one amino acid
             # and the N of another.
@@ -103,8 +110,7 @@ def get_residue_neighbors(residue, select=Select(), verbose=True):
             # First residue after the target in the chain list.
             next_res = residue.parent.child_list[residue.idx + 1]
             # Get valid atoms according to the provided selection function.
-            next_res_atms = {atm.name: atm for atm in next_res.get_atoms()
-                             if select.accept_atom(atm)}
+            next_res_atms = _atom_name_map(next_res, select)
 
             # A peptide bond exists between the C of one amino acid and
             # the N of another.
@@ -130,20 +136,13 @@ def get_residue_neighbors(residue, select=Select(), verbose=True):
                          "or there are missing residues." % residue)
         return neighbors
     else:
-        # First residue before the target in the chain list.
-        prev_res = residue.parent.child_list[residue.idx - 1]
-        # Get valid atoms according to the provided selection function.
-        prev_res_atms = {atm.name: atm for atm in prev_res.get_atoms()
-                         if select.accept_atom(atm)}
-
         neighbors = Neighbors()
         # If the chain has a residue coming before the target residue.
         if residue.idx - 1 >= 0:
             # First residue before the target in the chain list.
             prev_res = residue.parent.child_list[residue.idx - 1]
             # Get valid atoms according to the provided selection function.
-            prev_res_atms = {atm.name: atm for atm in prev_res.get_atoms()
-                             if select.accept_atom(atm)}
+            prev_res_atms = _atom_name_map(prev_res, select)
 
             for trgt_atm, prev_atm in product(trgt_res_atms.values(),
                                               prev_res_atms.values()):
@@ -168,8 +167,7 @@ def get_residue_neighbors(residue, select=Select(), verbose=True):
             # First residue after the target in the chain list.
             next_res = residue.parent.child_list[residue.idx + 1]
             # Get valid atoms according to the provided selection function.
-            next_res_atms = {atm.name: atm for atm in next_res.get_atoms()
-                             if select.accept_atom(atm)}
+            next_res_atms = _atom_name_map(next_res, select)
 
             # Check each pair of atoms for covalently bonded atoms.
             for trgt_atm, next_atm in product(trgt_res_atms.values(),
@@ -119,7 +119,10 @@ class AtomSelector(Selector):
 
     def __init__(self, entries, **kwargs):
         self.entries = entries
+        # Atoms are checked against a set, as ``entries`` may be a long list
+        # and accept_atom() is called for every atom of the structure.
+        self._entries_set = set(entries)
         super().__init__(**kwargs)
 
     def accept_atom(self, atom):
-        return super().accept_atom(atom) and atom in self.entries
+        return super().accept_atom(atom) and atom in self._entries_set
@@ -5,14 +5,13 @@ from os.path import exists
 from shutil import move as rename_pdb_file
 
 
-from openbabel.pybel import readfile
+from openbabel.pybel import readstring
 from openbabel.pybel import Molecule as PybelWrapper
 
 from rdkit.Chem import (MolFromMolBlock, SanitizeFlags,
-                        SanitizeMol, MolToMolFile)
+                        SanitizeMol, MolToMolBlock)
 
-from luna.util.file import (is_directory_valid, new_unique_filename,
-                            remove_files)
+from luna.util.file import is_directory_valid, new_unique_filename
 from luna.util.default_values import ENTRY_SEPARATOR, OPENBABEL
 from luna.MyBio.selector import AtomSelector
 from luna.MyBio.PDB.PDBList import PDBList
@@ -24,7 +23,7 @@ from luna.mol.validator import MolValidator
 from luna.mol.standardiser import Standardizer
 from luna.wrappers.base import MolWrapper
 from luna.wrappers.obabel import convert_molecule
-from luna.wrappers.rdkit import read_mol_from_file
+from luna.wrappers.rdkit import new_mol_from_block
 
 from luna.util.exceptions import (IllegalArgumentError, MoleculeNotFoundError,
                                   ChainNotFoundError, FileNotCreated,
@@ -120,7 +119,7 @@ def save_to_file(entity, output_file, select=Select(), write_conects=True,
     ----------
     entity : :class:`~luna.MyBio.PDB.Entity.Entity`
         The PDB object to be saved.
-    output_file : str
+    output_file : str or file-like object
         Save the selected atoms to this file.
     select : :class:`~luna.MyBio.PDB.PDBIO.Select`
         Decide which atoms will be saved at the PDB output.
@@ -286,11 +285,13 @@ def biopython_entity_to_mol(entity,
     openbabel : str
         Pathname to Open Babel.
     tmp_path : str
-        A temporary directory to where temporary files will be saved.
+        A temporary directory to where temporary files will be saved if
+        ``keep_tmp_files`` is True.
         If not provided, the system's default temporary directory will
         be used instead.
     keep_tmp_files : bool
-        If True, keep all temporary files. Otherwise, removes them in the end.
+        If True, save the intermediate PDB and MOL blocks at ``tmp_path``
+        for debugging. Otherwise, no temporary files are created.
 
     Returns
     -------
@@ -307,53 +308,59 @@ def biopython_entity_to_mol(entity,
 
     logger.debug("It will try to create a new MOL object from the provided "
                  "entity.")
-    logger.debug("Temporary files will be saved at '%s'." % tmp_path)
 
-    # First it saves the selection into a PDB file and then it converts the
-    # file to .mol. I had to do it because the OpenBabel 2.4.1 had a
+    # First it saves the selection into a PDB block and then it converts the
+    # block to .mol. I had to do it because the OpenBabel 2.4.1 had a
     # problem with some molecules containing aromatic rings. In such cases,
     # the aromatic ring was being wrongly perceived and some atoms received
     # more double bonds than it was expected. The version 2.3.2 works better.
     # Therefore, I recomend using Open Babel 2.3.3 instead.
+    #
+    # The PDB and MOL blocks are exchanged with Open Babel through its
+    # standard input and output, so no temporary file is needed. If
+    # 'keep_tmp_files' is True, they are also saved at 'tmp_path'.
     filename = new_unique_filename(tmp_path)
-    pdb_file = '%s_pdb-file.pdb' % filename
+    tmp_files = []
 
-    logger.debug("First: it will try to create a new PDB file (%s) "
-                 "from the provided entity." % pdb_file)
+    logger.debug("First: it will try to create a new PDB block "
+                 "from the provided entity.")
     # Apparently, Open Babel creates a bug when it tries to parse a file with
     # CONECTS containing serial numbers with more than 4 digits.
     # E.g.: 1OZH:A:HE3:1406, line CONECT162811627916282.
     # By setting preserve_atom_numbering to False, it solves the problem.
+    fh = StringIO()
     save_to_file(entity,
-                 pdb_file,
+                 fh,
                  select,
                  preserve_atom_numbering=False,
                  sort=True)
+    ini_input, ini_input_format = fh.getvalue(), "pdb"
+
+    if keep_tmp_files:
+        tmp_files.append(('%s_pdb-file.pdb' % filename, ini_input))
 
-    ini_input_file = pdb_file
     if template is not None:
         if entity.level == "R" and entity.is_hetatm():
             # Note that the template molecule should have no explicit hydrogens
             # else the algorithm will fail.
-            rdmol = read_mol_from_file(pdb_file, mol_format="pdb",
+            rdmol = new_mol_from_block(ini_input, mol_format="pdb",
                                        removeHs=True)
             new_rdmol = template.assign_bond_order(rdmol, entity.resname)
 
-            ini_input_file = '%s_tmp-mol-file.mol' % filename
-            MolToMolFile(new_rdmol, ini_input_file)
+            ini_input, ini_input_format = MolToMolBlock(new_rdmol), "mol"
 
-            if not keep_tmp_files:
-                remove_files([pdb_file])
+            if keep_tmp_files:
+                tmp_files.append(('%s_tmp-mol-file.mol' % filename,
+                                  ini_input))
         else:
             logger.warning("It cannot apply a template on the provided entity "
                            "because it should be a single compound "
                            "(Residue class).")
 
-    # Convert the PDB file to Mol file with the proper protonation
+    # Convert the PDB block to a MOL block with the proper protonation
     # and hydrogen addition if required.
-    mol_file = '%s_mol-file.mol' % filename
     ob_opt = {"error-level": 5}
-    logger.debug("Next: it will try to convert the PDB file to "
+    logger.debug("Next: it will try to convert the PDB block to "
                  " .mol using Open Babel.")
     if add_h:
         logger.debug("Hydrogens will be added to the molecule.")
@@ -361,8 +368,9 @@ def biopython_entity_to_mol(entity,
             ob_opt["p"] = ph
         else:
             ob_opt["h"] = ""
-    convert_molecule(ini_input_file, output_file=mol_file,
-                     opts=ob_opt, openbabel=openbabel)
+    mol_block = convert_molecule(ini_input, input_format=ini_input_format,
+                                 output_format="mol", opts=ob_opt,
+                                 openbabel=openbabel, is_block=True)
 
     # Currently, ignored atoms are only metals.
     ignored_atoms = []
@@ -373,12 +381,12 @@ def biopython_entity_to_mol(entity,
                      "it will try to fix some errors.")
 
         try:
-            mol_obj = next(readfile("mol", mol_file))
+            mol_obj = readstring("mol", mol_block)
         except Exception:
-            error_msg = ("An error occurred while parsing the file '%s' with "
-                         "Open Babel and the molecule object could not be "
-                         "created. Check the logs for more information."
-                         % mol_file)
+            error_msg = ("An error occurred while parsing the MOL block "
+                         "generated by Open Babel and the molecule object "
+                         "could not be created. Check the logs for more "
+                         "information.")
             raise MoleculeObjectError(error_msg)
 
         # Standardize a specific set of atoms if provided,
@@ -425,42 +433,42 @@ def biopython_entity_to_mol(entity,
 
             updated_metals_coord = rs.metals_coord
 
-            # After standardizing residues, we need to recreate the Mol
-            # file, otherwise implicit hydrogens will not be included
+            # After standardizing residues, we need to recreate the MOL
+            # block, otherwise implicit hydrogens will not be included
             # in the MOL object and, therefore, their coordinates could
             # not be accessed. If you try to generate coordinates directly
             # from the object, hydrogens will be incorrectly placed.
             mol_obj = PybelWrapper(mol_obj.unwrap())
-            new_mol_file = '%s_tmp-mol-file.mol' % filename
-            mol_obj.write("mol", new_mol_file, overwrite=True)
+            std_mol_block = mol_obj.write("mol")
 
-            # Overwrite mol_file by converting the new molecular file using
+            if keep_tmp_files:
+                tmp_files.append(('%s_tmp-mol-file.mol' % filename,
+                                  std_mol_block))
+
+            # Overwrite mol_block by converting the new MOL block using
             # the user specified parameters. Note that right now it will add
             # explicit hydrogens to the molecules according to the provided pH.
-            convert_molecule(new_mol_file, output_file=mol_file, 
-                             opts=ob_opt, openbabel=OPENBABEL)
+            mol_block = convert_molecule(std_mol_block, input_format="mol",
+                                         output_format="mol", opts=ob_opt,
+                                         openbabel=OPENBABEL, is_block=True)
 
-            # Let's finally read the correct and standardized molecular file.
+            # Let's finally read the correct and standardized MOL block.
             try:
-                mol_obj = next(readfile("mol", mol_file))
+                mol_obj = readstring("mol", mol_block)
             except Exception:
-                error_msg = ("An error occurred while parsing the file "
-                             "'%s' with Open Babel and the molecule object"
-                             "could not be created. Check the logs for "
-                             "more information." % mol_file)
+                error_msg = ("An error occurred while parsing the MOL block "
+                             "generated by Open Babel and the molecule "
+                             "object could not be created. Check the logs "
+                             "for more information.")
                 raise MoleculeObjectError(error_msg)
 
-            # Remove temporary files.
-            if not keep_tmp_files:
-                remove_files([new_mol_file])
-
         mv = MolValidator(metals_coord=updated_metals_coord)
         is_valid = mv.validate_mol(mol_obj, pdb_mapping)
         logger.debug('Validation finished!!!')
 
         if not is_valid:
-            logger.warning("The molecular file '%s' contain invalid atoms. "
-                           "Check the logs for more information." % mol_file)
+            logger.warning("The molecule contains invalid atoms. "
+                           "Check the logs for more information.")
 
         # Validate molecule using RDKit sanitization methods.
         try:
@@ -477,24 +485,26 @@ def biopython_entity_to_mol(entity,
             SanitizeMol(aux_mol, SanitizeFlags.SANITIZE_ALL)
         except Exception:
             error_msg = ("An error occurred while parsing the molecular block "
-                         "with RDKit. The block was generated by Open Babel "
-                         "from the file '%s'. Check the logs for more "
-                         "information." % mol_file)
+                         "with RDKit. The block was generated by Open Babel. "
+                         "Check the logs for more information.")
             raise MoleculeObjectError(error_msg)
     else:
         try:
             # Create a new Mol object.
-            mol_obj = next(readfile("mol", mol_file))
+            mol_obj = readstring("mol", mol_block)
         except Exception:
-            error_msg = ("An error occurred while parsing the file '%s' and "
-                         "the molecule object could not be created. "
-                         "Check the logs for more information."
-                         % mol_file)
+            error_msg = ("An error occurred while parsing the MOL block "
+                         "generated by Open Babel and the molecule object "
+                         "could not be created. Check the logs for more "
+                         "information.")
             raise MoleculeObjectError(error_msg)
 
-    # Remove temporary files.
-    if not keep_tmp_files:
-        remove_files([ini_input_file, mol_file])
+    # Save the intermediate molecular blocks for debugging.
+    if keep_tmp_files:
+        tmp_files.append(('%s_mol-file.mol' % filename, mol_block))
+        for tmp_file, block in tmp_files:
+            with open(tmp_file, "w") as OUT:
+                OUT.write(block)
 
     if wrapped:
         mol_obj = MolWrapper(mol_obj)
@@ -67,9 +67,12 @@ def count_interaction_types(interactions,
                     is_valid = True
 
             if compounds:
-                if (len(i.src_grp.compounds & compounds) > 0
-                        or len(i.trgt_grp.compounds & compounds)):
-                    is_valid = True
+                # Test the atoms' parents directly instead of building the
+                # groups' compound sets only to intersect them.
+                for grp in (i.src_grp, i.trgt_grp):
+                    if not compounds.isdisjoint(a.parent for a in grp.atoms):
+                        is_valid = True
+                        break
 
         if is_valid:
             pair_key1 = (i.type, i.src_grp, i.trgt_grp)
@@ -81,12 +84,9 @@ def count_interaction_types(interactions,
             seen_pairs.add(pair_key1)
             key = i.type
             if key_map:
-                if i.type in key_map:
-                    if key_map[i.type] is None:
-                        continue
-                    key = key_map[i.type]
-                else:
-                    key = i.type
+                key = key_map.get(i.type, i.type)
+                if key is None:
+                    continue
 
             interaction_types_count[key] += 1
     return interaction_types_count
@@ -4,14 +4,14 @@ from itertools import combinations, product
 from collections import defaultdict
 import json
 
-from luna.interaction.config import DefaultInteractionConfig, InteractionConfig
+from luna.interaction.config import InteractionConfig
 from luna.interaction.filter import InteractionFilter
 from luna.interaction.type import InteractionType
 from luna.mol.features import ChemicalFeature
 from luna.wrappers.base import BondType
 from luna.analysis.summary import count_interaction_types
 import luna.util.math as im
-from luna.util.default_values import BOUNDARY_CONFIG
+from luna.util.default_values import BOUNDARY_CONFIG, INTERACTION_CONFIG
 from luna.util.exceptions import IllegalArgumentError
 from luna.mol.groups import AtomGroupNeighborhood
 from luna.util.file import pickle_data, unpickle_data
@@ -107,7 +107,7 @@ class InteractionsManager:
         """Add one or more :class:`~luna.interaction.type.InteractionType`
         objects to ``interactions``."""
 
-        self._interactions = list(set(self.interactions + list(interactions)))
+        self._interactions = list(set(self.interactions).union(interactions))
 
     def remove_interactions(self, interactions):
         """Remove one or more :class:`~luna.interaction.type.InteractionType`
@@ -115,7 +115,8 @@ class InteractionsManager:
 
         Any recursive references to the removed objects will also be cleared.
         """
-        self._interactions = list(set(self.interactions) - set(interactions))
+        self._interactions = \
+            list(set(self.interactions).difference(interactions))
 
         for inter in interactions:
             inter.clear_refs()
@@ -172,12 +173,22 @@ class InteractionsManager:
         output_file : str
             The output CSV file.
         """
+        # An atom group usually takes part in several interactions, so its
+        # string representation is built only once.
+        grp_strs = {}
+
+        def grp_to_str(atm_grp):
+            grp_str = grp_strs.get(atm_grp)
+            if grp_str is None:
+                grp_str = ";".join(sorted([a.full_atom_name
+                                           for a in atm_grp.atoms]))
+                grp_strs[atm_grp] = grp_str
+            return grp_str
+
         interactions_set = set()
         for inter in self.interactions:
-            grp1 = ";".join(sorted(["/".join(a.full_atom_name.split("/"))
-                                    for a in inter.src_grp.atoms]))
-            grp2 = ";".join(sorted(["/".join(a.full_atom_name.split("/"))
-                                    for a in inter.trgt_grp.atoms]))
+            grp1 = grp_to_str(inter.src_grp)
+            grp2 = grp_to_str(inter.trgt_grp)
 
             grp1, grp2 = sorted([grp1, grp2])
             interactions_set.add((grp1, grp2, inter.type))
@@ -546,7 +557,7 @@ inter_config=custom_config)
 
     """
 
-    def __init__(self, inter_config=DefaultInteractionConfig(),
+    def __init__(self, inter_config=INTERACTION_CONFIG,
                  inter_filter=None, inter_funcs=None, add_non_cov=True,
                  add_cov=True, add_proximal=False, add_atom_atom=True,
                  add_dependent_inter=False,
@@ -627,6 +638,9 @@ inter_config=custom_config)
         #       For example, a hydrogen bond not included for 0.01A.
         #           Distances: 0.2 and Angles: 5
 
+        # Target atom groups are traversed more than once.
+        trgt_atm_grps = list(trgt_atm_grps)
+
         # If nb_atm_grps was not informed, it uses the trgt_atm_grps as the
         # neighbors. In this case, the interactions will be target x target.
         nb_comp_grps = nb_atm_grps or trgt_atm_grps
@@ -641,8 +655,14 @@ inter_config=custom_config)
         bsite_cutoff = self.inter_config.get(bsite_param,
                                              BOUNDARY_CONFIG[bsite_param])
 
-        for trgt_atm_grp in trgt_atm_grps:
-            for nb_atm_grp in ss.search(trgt_atm_grp.centroid, bsite_cutoff):
+        # Search the neighbors of all target atom groups at once.
+        nb_atm_grps_list = \
+            ss.search_batch([atm_grp.centroid for atm_grp in trgt_atm_grps],
+                            bsite_cutoff)
+
+        for trgt_atm_grp, trgt_nb_atm_grps in zip(trgt_atm_grps,
+                                                   nb_atm_grps_list):
+            for nb_atm_grp in trgt_nb_atm_grps:
 
                 # It will always ignore interactions involving the same atom
                 # groups. Loops in the graph is not permitted and does not make
@@ -728,8 +748,8 @@ inter_config=custom_config)
         if not self.add_h2o_pairs_with_no_target:
             self.remove_h2o_pairs_with_no_target(all_interactions)
 
-        logger.debug("Number of potential interactions found: %d"
-                     % len(all_interactions))
+        logger.debug("Number of potential interactions found: %d",
+                     len(all_interactions))
 
         return InteractionsManager(all_interactions)
 
@@ -902,8 +922,8 @@ inter_config=custom_config)
                 hbond_inconsistences[key].append(inter)
             elif inter.type == "Unfavorable anion-nucleophile":
                 nucl_grp = (inter.src_grp
-                            if any([f.name == "Nucleophile"
-                                    for f in inter.src_grp.features])
+                            if any(f.name == "Nucleophile"
+                                   for f in inter.src_grp.features)
                             else inter.trgt_grp)
                 # A nucleophile may have only 1 atom (water oxygen).
                 nucl_atm = nucl_grp.atoms[0]
@@ -930,16 +950,16 @@ inter_config=custom_config)
                 hbond_inconsistences[key].append(inter)
             elif inter.type == "Amide-aromatic stacking":
                 amide_grp = (inter.src_grp
-                             if any([f.name == "Amide"
-                                     for f in inter.src_grp.features])
+                             if any(f.name == "Amide"
+                                    for f in inter.src_grp.features)
                              else inter.trgt_grp)
                 arom_grp = inter.get_partner(amide_grp)
                 for amide_atm in amide_grp.atoms:
                     amide_inconsistences[(amide_atm, arom_grp)].append(inter)
             elif inter.type == "Unfavorable cation-electrophile":
                 elect_grp = (inter.src_grp
-                             if any([f.name == "Nucleophile"
-                                     for f in inter.src_grp.features])
+                             if any(f.name == "Nucleophile"
+                                    for f in inter.src_grp.features)
                              else inter.trgt_grp)
                 # A nucleophile may have only 1 atom (water oxygen).
                 elect_atm = elect_grp.atoms[0]
@@ -957,7 +977,7 @@ inter_config=custom_config)
         inconsistencies = set()
         for (atm1, atm2), inters in hbond_inconsistences.items():
             if (len(inters) > 1
-                    and any([i.type == "Hydrogen bond" for i in inters])):
+                    and any(i.type == "Hydrogen bond" for i in inters)):
                 inconsistencies.update([i for i in inters
                                         if i.type != "Hydrogen bond"])
 
@@ -1210,7 +1230,7 @@ inter_config=custom_config)
             # definition is not possible as it depends on angle criterion.
             # Therefore, a more general classification is used instead, i.e.,
             # all interactions will be Pi-stacking.
-            if any([c not in self.inter_config for c in criteria]):
+            if any(c not in self.inter_config for c in criteria):
                 inter_type = "Pi-stacking"
             elif self.is_within_boundary(min_disp_angle,
                                          "min_disp_ang_offset_pi_pi_inter",
@@ -71,15 +71,15 @@ f"{LUNA_PATH}/tutorial/inputs/3QQK.pdb")
             raise EntityLevelError("The defined level '%s' does not exist"
                                    % level)
 
-        logger.debug("Trying to select all contacts in the PDB file %s."
-                     % entity.get_parent_by_level('S').id)
+        logger.debug("Trying to select all contacts in the PDB file %s.",
+                     entity.get_parent_by_level('S').id)
 
         all_atoms = list(entity.get_atoms())
         ns = NeighborSearch(all_atoms)
         pairs = ns.search_all(radius, level)
 
-        logger.debug("Number of nearby %s(s) found: %d."
-                     % (ENTITY_LEVEL_NAME[level].lower(), len(pairs)))
+        logger.debug("Number of nearby %s(s) found: %d.",
+                     ENTITY_LEVEL_NAME[level].lower(), len(pairs))
 
         return pairs
     except Exception as e:
@@ -91,7 +91,8 @@ def get_contacts_with(source,
                       target=None,
                       entity=None,
                       radius=BOUNDARY_CONFIG["bsite_cutoff"],
-                      level='A'):
+                      level='A',
+                      nb_search=None):
     """Recover atoms or residues in contact with ``source``.
 
     Parameters
@@ -110,6 +111,12 @@ def get_contacts_with(source,
         The default value is 6.2.
     level : {'R', 'A'}
         Return residues ('R') or atoms ('A') in contact with ``source``.
+    nb_search : NeighborSearch, optional
+        A precomputed
+        :class:`~luna.MyBio.PDB.NeighborSearch.NeighborSearch` object
+        built over the target atoms.
+        If provided, ``target`` and ``entity`` are ignored, which avoids
+        rebuilding the KD tree when it is queried multiple times.
 
     Returns
     -------
@@ -206,38 +213,42 @@ f"{LUNA_PATH}/tutorial/inputs/3QQK.pdb")
             raise EntityLevelError("The defined level '%s' does not exist"
                                    % level)
 
-        entity = entity or source.get_parent_by_level("M")
-
         source_atoms = Selection.unfold_entities([source], 'A')
 
-        target_atoms = []
-        if target is None:
-            target_atoms = list(entity.get_atoms())
-        else:
-            if target.level == "A":
-                target_atoms = [target]
-            else:
-                target_residues = Selection.unfold_entities(target, 'R')
-                target_atoms = [a for r in target_residues
-                                for a in r.get_unpacked_list()]
+        if nb_search is None:
+            entity = entity or source.get_parent_by_level("M")
 
-        ns = NeighborSearch(target_atoms)
+            target_atoms = []
+            if target is None:
+                target_atoms = list(entity.get_atoms())
+            else:
+                if target.level == "A":
+                    target_atoms = [target]
+                else:
+                    target_residues = Selection.unfold_entities(target, 'R')
+                    target_atoms = [a for r in target_residues
+                                    for a in r.get_unpacked_list()]
+
+            nb_search = NeighborSearch(target_atoms)
+
+        # Query all source atoms at once.
+        nb_entities_list = nb_search.search_batch([atom.coord
+                                                   for atom in source_atoms],
+                                                  radius, level)
         entities = set()
-        for atom in source_atoms:
+        for atom, nb_entities in zip(source_atoms, nb_entities_list):
             entity = atom.get_parent_by_level(level)
-            nb_entities = ns.search(atom.coord, radius, level)
-            pairs = set(product([entity], nb_entities))
-            entities.update(pairs)
+            entities.update(product([entity], nb_entities))
 
-        logger.debug("Number of nearby %s(s) found: %d."
-                     % (ENTITY_LEVEL_NAME[level].lower(), len(entities)))
+        logger.debug("Number of nearby %s(s) found: %d.",
+                     ENTITY_LEVEL_NAME[level].lower(), len(entities))
         return entities
     except Exception as e:
         logger.exception(e)
         raise
 
 
-def get_proximal_compounds(source, radius=COV_SEARCH_RADIUS):
+def get_proximal_compounds(source, radius=COV_SEARCH_RADIUS, nb_search=None):
     """Recover proximal compounds to ``source``.
 
     Parameters
@@ -248,6 +259,12 @@ def get_proximal_compounds(source, radius=COV_SEARCH_RADIUS):
         The cutoff distance (in Å) for defining proximity.
         The default value is 2.2, which may recover potential residues bound to
         ``source`` through covalent bonds.
+    nb_search : NeighborSearch, optional
+        A precomputed
+        :class:`~luna.MyBio.PDB.NeighborSearch.NeighborSearch` object
+        built over all atoms of the
+        model that contains ``source``. Provide it to reuse the same KD tree
+        when recovering proximal compounds for several residues.
 
     Returns
     -------
@@ -292,7 +309,8 @@ f"{LUNA_PATH}/tutorial/inputs/3QQK.pdb")
 
     model = source.get_parent_by_level('M')
     proximal = get_contacts_with(source, entity=model,
-                                 radius=radius, level='R')
+                                 radius=radius, level='R',
+                                 nb_search=nb_search)
 
     # Sorted by the compound order as in the PDB.
     return sorted(list(set([p[1] for p in proximal])),
@@ -769,8 +769,21 @@ class Fingerprint:
         >>> print(fp1.calc_similarity(fp2))
         0.625
         """
-        return DataStructs.FingerprintSimilarity(self.to_rdkit(),
-                                                 other.to_rdkit())
+        # RDKit folds fingerprints with different lengths or longer than
+        # its maximum length (2^31 - 1) before comparing them.
+        if (self.fp_length != other.fp_length
+                or self.fp_length > 2**31 - 1):
+            return DataStructs.FingerprintSimilarity(self.to_rdkit(),
+                                                     other.to_rdkit())
+
+        # Otherwise, the Tanimoto similarity is calculated directly from the
+        # sorted and unique "on" bits, without creating RDKit fingerprints.
+        n_common = np.intersect1d(self.indices, other.indices,
+                                  assume_unique=True).shape[0]
+        n_total = self.bit_count + other.bit_count - n_common
+        if n_total == 0:
+            return 0.0
+        return n_common / n_total
 
     def __repr__(self):
         return ("<%s: indices=%s length=%d>" %
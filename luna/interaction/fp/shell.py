@@ -11,7 +11,7 @@ from luna.interaction.fp.fingerprint import (DEFAULT_FP_LENGTH, Fingerprint,
                                              CountFingerprint)
 from luna.interaction.fp.type import IFPType
 from luna.mol.groups import PseudoAtomGroup, AtomGroupNeighborhood
-from luna.mol.features import ChemicalFeature
+from luna.mol.features import get_chemical_feature
 
 
 import logging
@@ -1057,7 +1057,7 @@ class ShellGenerator:
         # Map an atom to all of its pseudo-groups.
         pseudo_grps_mapping = defaultdict(set)
         for pseudo_grp in pseudo_grps:
-            atoms = tuple(sorted(pseudo_grp.atoms))
+            atoms = pseudo_grp.key
             for atm in atoms:
                 # Add an atom to the mapping
                 pseudo_grps_mapping[(atm,)].add(pseudo_grp)
@@ -1074,12 +1074,21 @@ class ShellGenerator:
         for level in range(self.num_levels):
             radius = self.radius_step * level
 
-            for atm_grp in sorted_neighborhood:
+            # Ignore centroids that already reached the limit of possible
+            # substructures.
+            active_atm_grps = [ag for ag in sorted_neighborhood
+                               if ag not in skip_atm_grps]
 
-                # Ignore centroids that already reached the limit of possible
-                # substructures.
-                if atm_grp in skip_atm_grps:
-                    continue
+            # The neighbors of every active centroid are queried at once.
+            # It is safe as a group is only skipped after being processed.
+            nb_atm_grps_by_grp = {}
+            if radius > 0:
+                centroids = [ag.centroid for ag in active_atm_grps]
+                nb_atm_grps_by_grp = \
+                    dict(zip(active_atm_grps,
+                             nbs.search_batch(centroids, radius)))
+
+            for atm_grp in active_atm_grps:
 
                 # It stores all possible expansions each group can do.
                 # Each expansion is a derived group. Initially, the list
@@ -1106,7 +1115,7 @@ class ShellGenerator:
                     prev_atm_grps = prev_shell.neighborhood
                     prev_interactions = prev_shell.interactions
 
-                    nb_atm_grps = set(nbs.search(atm_grp.centroid, radius))
+                    nb_atm_grps = set(nb_atm_grps_by_grp[atm_grp])
 
                     inter_tuples = set()
                     interactions_to_add = set()
@@ -1228,11 +1237,11 @@ class ShellGenerator:
                 break
 
         logger.debug("Shells creation finished.")
-        logger.debug("The last level executed was: %d." % level)
-        logger.debug("The number of levels defined was: %d." % self.num_levels)
-        logger.debug("Total number of shells created: %d" % sm.num_shells)
-        logger.debug("Total number of unique shells created: %d"
-                     % sm.num_unique_shells)
+        logger.debug("The last level executed was: %d.", level)
+        logger.debug("The number of levels defined was: %d.", self.num_levels)
+        logger.debug("Total number of shells created: %d", sm.num_shells)
+        logger.debug("Total number of unique shells created: %d",
+                     sm.num_unique_shells)
 
         return sm
 
@@ -1254,7 +1263,7 @@ class ShellGenerator:
                 for atm_grp, atms in [src_tuple, trgt_tuple]:
                     # It will get a pseudo-group already created or create
                     # a new one.
-                    feats = [ChemicalFeature("Hydrophobe")]
+                    feats = [get_chemical_feature("Hydrophobe")]
                     pseudo_grp = \
                         pseudo_grps.get(atms,
                                         PseudoAtomGroup(atm_grp, atms, feats))
@@ -133,6 +133,7 @@ class ExtendedAtom:
         self._nb_info = nb_info or []
         self._atm_grps = atm_grps or []
         self._invariants = invariants
+        self._hash_cache = None
 
     @property
     def atom(self):
@@ -208,20 +209,20 @@ class ExtendedAtom:
 
     def add_nb_info(self, nb_info):
         """ Add `AtomData` objects to ``neighbors_info``."""
-        self._nb_info = list(set(self._nb_info + list(nb_info)))
+        self._nb_info = list(set(self._nb_info).union(nb_info))
 
     def add_atm_grps(self, atm_grps):
         """ Add :class:`~luna.groups.AtomGroup` objects to ``atm_grps``."""
-        self._atm_grps = list(set(self._atm_grps + list(atm_grps)))
+        self._atm_grps = list(set(self._atm_grps).union(atm_grps))
 
     def remove_nb_info(self, nb_info):
         """ Remove `AtomData` objects from ``neighbors_info``."""
-        self._nb_info = list(set(self._nb_info) - set(nb_info))
+        self._nb_info = list(set(self._nb_info).difference(nb_info))
 
     def remove_atm_grps(self, atm_grps):
         """ Remove :class:`~luna.groups.AtomGroup` objects from
         ``atm_grps``."""
-        self._atm_grps = list(set(self._atm_grps) - set(atm_grps))
+        self._atm_grps = list(set(self._atm_grps).difference(atm_grps))
 
     def get_neighbor_info(self, atom):
         """Get information from a covalently bound atom."""
@@ -258,14 +259,21 @@ class ExtendedAtom:
                 "name": full_id[4]}
 
     def __getattr__(self, attr):
-        if hasattr(self._atom, attr):
-            return getattr(self._atom, attr)
+        # While unpickling, attributes may be looked up before the state
+        # (and hence '_atom') is restored.
+        atom = self.__dict__.get("_atom")
+        if atom is not None and hasattr(atom, attr):
+            return getattr(atom, attr)
         else:
             raise AttributeError("The attribute '%s' does not exist in the "
                                  "class %s." % (attr, self.__class__.__name__))
 
     def __getstate__(self):
-        return self.__dict__
+        # String hashes are salted per process, so the cached hash must not
+        # be restored in a different one.
+        state = self.__dict__.copy()
+        state["_hash_cache"] = None
+        return state
 
     def __setstate__(self, state):
         self.__dict__.update(state)
@@ -279,8 +287,12 @@ class ExtendedAtom:
 
     def __eq__(self, other):
         """Overrides the default implementation"""
+        if self is other:
+            return True
         if isinstance(self, other.__class__):
-            return self.full_atom_name == other.full_atom_name
+            # Different hashes imply different full atom names.
+            return (hash(self) == hash(other)
+                    and self.full_atom_name == other.full_atom_name)
         return False
 
     def __ne__(self, other):
@@ -297,4 +309,11 @@ class ExtendedAtom:
 
     def __hash__(self):
         """Overrides the default implementation"""
-        return hash(self.full_atom_name)
+        # Atoms are hashed every time they are looked up in sets, dicts, and
+        # graphs, so the full atom name is built and hashed only once.
+        # Objects pickled by older versions may not have the attribute.
+        hash_cache = self.__dict__.get("_hash_cache")
+        if hash_cache is None:
+            hash_cache = hash(self.full_atom_name)
+            self._hash_cache = hash_cache
+        return hash_cache
@@ -1,5 +1,3 @@
-from luna.wrappers.base import AtomWrapper
-
 import logging
 logger = logging.getLogger()
 
@@ -7,6 +5,44 @@ logger = logging.getLogger()
 # TODO: implement this other model: https://github.com/openbabel/openbabel/blob/master/src/formats/mdlvalence.h
 
 
+# Formal charges of the OpenEye model indexed by (atomic number, valence).
+# Hydrogens, carbons with valence 3, and sulfurs with valence 4 are handled
+# in OpenEyeModel.get_charge() as they do not depend only on the valence.
+_FORMAL_CHARGES = {
+    # Carbon
+    (6, 4): 0,
+    # Nitrogen
+    (7, 2): -1, (7, 3): 0, (7, 4): 1,
+    # Oxygen
+    (8, 1): -1, (8, 2): 0, (8, 3): 1,
+    # Phosphorus
+    (15, 4): 1,
+    # Sulfur
+    (16, 1): -1, (16, 3): 1, (16, 5): -1,
+    # Chlorine
+    (17, 0): -1, (17, 1): 0, (17, 4): 3,
+    # Fluorine, Bromine, Iodine
+    (9, 0): -1, (9, 1): 0,
+    (35, 0): -1, (35, 1): 0,
+    (53, 0): -1, (53, 1): 0,
+    # Magnesium, Calcium, Zinc
+    (12, 0): 2, (12, 2): 0,
+    (20, 0): 2, (20, 2): 0,
+    (30, 0): 2, (30, 2): 0,
+    # Lithium, Sodium, Potassium
+    (3, 0): 1, (3, 1): 0,
+    (11, 0): 1, (11, 1): 0,
+    (19, 0): 1, (19, 1): 0,
+    # Boron
+    #   If the valence is four, the formal charge is -1.
+    #   OBS: there is an error in OpenEye chargel model text,
+    #   they said that Boron should have a charge of +1 when
+    #   the valence is 4.
+    #   However, the MDL Valence Model says it should be -1.
+    (5, 3): 0, (5, 4): -1,
+}
+
+
 class ChargeModel:
     """Implementation of a charge model."""
 
@@ -48,114 +84,24 @@ class OpenEyeModel(ChargeModel):
         Charge for atom #4 (O): 0.
 
         """
-        formal_charge = None
-
         atm_num = atm_obj.get_atomic_num()
         valence = atm_obj.get_valence()
 
         # Hydrogen
         if atm_num == 1:
-            if valence != 1:
-                formal_charge = 1
-            elif valence == 1:
-                formal_charge = 0
+            return 0 if valence == 1 else 1
 
         # Carbon
-        elif atm_num == 6:
-            if valence == 3:
-                has_polar_nb = False
-                nbs = atm_obj.get_neighbors()
-                for nb_atm_obj in nbs:
-                    nb_atm_obj = AtomWrapper(nb_atm_obj)
-                    # Polar neighbor: N, O or S
-                    if nb_atm_obj.get_atomic_num() in (7, 8, 16):
-                        has_polar_nb = True
-                        break
-                if has_polar_nb is True:
-                    formal_charge = 1
-                else:
-                    formal_charge = -1
-            elif valence == 4:
-                formal_charge = 0
-
-        # Nitrogen
-        elif atm_num == 7:
-            if valence == 2:
-                formal_charge = -1
-            elif valence == 4:
-                formal_charge = 1
-            elif valence == 3:
-                formal_charge = 0
-
-        # Oxygen
-        elif atm_num == 8:
-            if valence == 1:
-                formal_charge = -1
-            elif valence == 3:
-                formal_charge = 1
-            elif valence == 2:
-                formal_charge = 0
-
-        # Phosphorus
-        elif atm_num == 15:
-            if valence == 4:
-                formal_charge = 1
+        if atm_num == 6 and valence == 3:
+            # Polar neighbor: N, O or S
+            for nb_atm_obj in atm_obj.get_neighbors(wrapped=False):
+                if nb_atm_obj.GetAtomicNum() in (7, 8, 16):
+                    return 1
+            return -1
 
         # Sulfur
-        elif atm_num == 16:
-            if valence == 1:
-                formal_charge = -1
-            elif valence == 3:
-                formal_charge = 1
-            elif valence == 5:
-                formal_charge = -1
-            elif valence == 4:
-                if atm_obj.get_degree() == 4:
-                    formal_charge = 2
-            elif valence == 2 or valence == 6:
-                formal_charge == 0
-
-        # Chlorine
-        elif atm_num == 17:
-            if valence == 0:
-                formal_charge = -1
-            elif valence == 4:
-                formal_charge = 3
-            elif valence == 1:
-                formal_charge = 0
-
-        # Fluorine, Bromine, Iodine
-        elif atm_num == 9 or atm_num == 35 or atm_num == 53:
-            if valence == 0:
-                formal_charge = -1
-            elif valence == 1:
-                formal_charge = 0
-
-        # Magnesium, Calcium, Zinc
-        elif atm_num == 12 or atm_num == 20 or atm_num == 30:
-            if valence == 0:
-                formal_charge = 2
-            elif valence == 2:
-                formal_charge = 0
-
-        # Lithium, Sodium, Potassium
-        elif atm_num == 3 or atm_num == 11 or atm_num == 19:
-            if valence == 0:
-                formal_charge = 1
-            elif valence == 1:
-                formal_charge = 0
-
-        # Boron
-        elif atm_num == 5:
-            # If the valence is four, the formal charge is -1.
-            # OBS: there is an error in OpenEye chargel model text,
-            # they said that Boron should have a charge of +1 when
-            # the valence is 4.
-            # However, the MDL Valence Model says it should be -1.
-            if valence == 4:
-                formal_charge = -1
-            elif valence == 3:
-                formal_charge = 0
+        if atm_num == 16 and valence == 4:
+            return 2 if atm_obj.get_degree() == 4 else None
 
         # Iron: 26
         # If the valence is zero, the formal charge is +3 if the partial charge is 3.0, and +2 otherwise.
@@ -164,4 +110,4 @@ class OpenEyeModel(ChargeModel):
         # else:
         # For the remaining elements, if the valence of an atom is zero, its formal charge is set from its partial charge.
 
-        return formal_charge
+        return _FORMAL_CHARGES.get((atm_num, valence))
@@ -63,6 +63,8 @@ def calc_distance_matrix(fps, similarity_func="BulkTanimotoSimilarity"):
     if similarity_func not in funcs:
         raise IllegalArgumentError("Similarity function not available.")
 
+    bulk_func = getattr(DataStructs, similarity_func)
+
     dists = []
     for i in range(1, len(fps)):
         if (similarity_func == "BulkTverskySimilarity"):
@@ -70,8 +72,9 @@ def calc_distance_matrix(fps, similarity_func="BulkTanimotoSimilarity"):
         else:
             params = [fps[i], fps[:i]]
 
-        sims = getattr(DataStructs, similarity_func)(*params)
-        dists.extend([1 - x for x in sims])
+        # Let RDKit return distances (1 - similarity) directly instead of
+        # converting each similarity value in Python.
+        dists.extend(bulk_func(*params, returnDistance=True))
 
     return dists
 
@@ -1,13 +1,14 @@
 import re
 import logging
 from operator import xor
-from os.path import exists
+from os.path import exists, getmtime
 from collections import defaultdict
+from functools import lru_cache
 import ast
 
 from rdkit.Chem import Mol as RDMol
 from openbabel import OBMol
-from openbabel.pybel import readfile
+from openbabel.pybel import readfile, readstring
 from openbabel.pybel import Molecule as PybelMol
 from openbabel.pybel import informats as OB_FORMATS
 
@@ -16,7 +17,8 @@ from luna.wrappers.rdkit import (RDKIT_FORMATS, read_multimol_file,
 from luna.wrappers.base import MolWrapper
 from luna.util.default_values import (ACCEPTED_MOL_OBJ_TYPES, ENTRY_SEPARATOR,
                                       ARTIFACTS_LIST)
-from luna.util.file import get_file_format, get_filename
+from luna.util.file import (get_file_format, get_filename,
+                            detect_compression_format)
 from luna.util.exceptions import (InvalidEntry,
                                   IllegalArgumentError,
                                   MoleculeObjectError,
@@ -34,6 +36,60 @@ PPI_ENTRY_REGEX = re.compile(r'^.{1,255}:\w$')
 
 REGEX_RESNUM_ICODE = re.compile(r'^([\-\+]?\d+)([a-zA-z]?)$')
 
+# Molecular formats whose blocks can be located without parsing the file.
+INDEXABLE_FORMATS = ("mol2", "mol", "mdl", "sdf", "sd")
+
+
+@lru_cache(maxsize=32)
+def _index_multimol_file(mol_file, mol_file_ext, mtime):
+    """Map the molecule ids in a multimolecular file to the position (in
+    bytes) where their blocks start. Only the first occurrence of an id is
+    kept. The modification time ``mtime`` invalidates outdated indices."""
+    index = {}
+
+    is_mol2 = mol_file_ext == "mol2"
+    block_start = 0
+    read_title = not is_mol2
+    offset = 0
+    with open(mol_file, "rb") as IN:
+        for line in IN:
+            if read_title:
+                title = line.decode(errors="replace").strip()
+                index.setdefault(title, block_start)
+                read_title = False
+            elif is_mol2 and line.startswith(b"@<TRIPOS>MOLECULE"):
+                # In MOL2 files, the title is the line after the header.
+                block_start = offset
+                read_title = True
+            elif not is_mol2 and line.startswith(b"$$$$"):
+                # In MOL/SDF files, the title is the first line of a block.
+                block_start = offset + len(line)
+                read_title = True
+            offset += len(line)
+
+    return index
+
+
+def _read_mol_block(mol_file, mol_file_ext, offset):
+    """Read the molecule block starting at position ``offset`` in
+    ``mol_file``."""
+    lines = []
+    # Byte offsets are only valid on binary streams.
+    with open(mol_file, "rb") as IN:
+        IN.seek(offset)
+        for line in IN:
+            if mol_file_ext == "mol2":
+                if line.startswith(b"@<TRIPOS>MOLECULE") and lines:
+                    break
+                lines.append(line)
+            else:
+                lines.append(line)
+                if line.startswith(b"$$$$"):
+                    break
+    # Decoded as the titles in _index_multimol_file(), so that the block
+    # title always matches the molecule id it was indexed by.
+    return b"".join(lines).decode(errors="replace")
+
 
 class Entry:
     """Entries determine the target molecule to which interactions and other
@@ -1087,7 +1143,7 @@ not found in the
         return self._mol_obj is not None
 
     def _load_mol_from_file(self):
-        logger.debug("It will try to load the molecule '%s'." % self.mol_id)
+        logger.debug("It will try to load the molecule '%s'.", self.mol_id)
 
         if self.mol_file is None:
             raise IllegalArgumentError("It cannot load the molecule as no "
@@ -1107,7 +1163,10 @@ not found in the
                                     % self.mol_file)
 
         try:
-            if self.mol_obj_type == "openbabel":
+            if self.is_multimol_file and self._load_mol_from_index():
+                logger.debug("Molecule '%s' was read directly from its "
+                             "position in '%s'.", self.mol_id, self.mol_file)
+            elif self.mol_obj_type == "openbabel":
                 mols = readfile(self.mol_file_ext, self.mol_file)
                 # If it is a multimol file, then we need to loop over the
                 # molecules to find the target one. Note that in this case,
@@ -1162,7 +1221,39 @@ not found in the
             if not self.mol_obj.has_name() or self.overwrite_mol_name:
                 self.mol_obj.set_name(self.mol_id)
 
-        logger.debug("Molecule '%s' was successfully loaded." % self.mol_id)
+        logger.debug("Molecule '%s' was successfully loaded.", self.mol_id)
+
+    def _load_mol_from_index(self):
+        # Without an index, each entry from a multimolecular file would scan
+        # the file from its beginning. Instead, the file is indexed once per
+        # process and only the target block is parsed. It returns False if
+        # the molecule could not be located, so the file can be scanned.
+        if (self.mol_file_ext not in INDEXABLE_FORMATS
+                or detect_compression_format(self.mol_file)):
+            return False
+
+        index = _index_multimol_file(self.mol_file, self.mol_file_ext,
+                                     getmtime(self.mol_file))
+        offset = index.get(self.mol_id)
+        if offset is None:
+            return False
+
+        if self.mol_obj_type == "openbabel":
+            block = _read_mol_block(self.mol_file, self.mol_file_ext, offset)
+            ob_mol = readstring(self.mol_file_ext, block)
+            if get_filename(ob_mol.OBMol.GetTitle()) != self.mol_id:
+                return False
+            self.mol_obj = ob_mol
+            return True
+
+        for rdk_mol, mol_id in read_multimol_file(self.mol_file,
+                                                  mol_format=self.mol_file_ext,
+                                                  targets=[self.mol_id],
+                                                  removeHs=False,
+                                                  offset=offset):
+            self.mol_obj = rdk_mol
+            return True
+        return False
 
     def get_biopython_structure(self, entity=None, parser=None):
         """Transform the molecular object into a Biopython Entity object.
@@ -1,7 +1,7 @@
 from collections import defaultdict
 
 # Open Babel
-from openbabel.openbabel import OBMol, OBSmartsPattern
+from openbabel.openbabel import OBMol
 from openbabel.pybel import Molecule as PybelMol
 # RDKit
 from rdkit.Chem import Mol as RDMol
@@ -9,6 +9,7 @@ from rdkit.Chem import Mol as RDMol
 from luna.util import stringcase as case
 from luna.util.exceptions import MoleculeObjectTypeError
 from luna.wrappers.base import MolWrapper
+from luna.wrappers.obabel import get_smarts_pattern
 
 import logging
 logger = logging.getLogger()
@@ -45,6 +46,8 @@ class ChemicalFeature():
 
     def __eq__(self, other):
         """Overrides the default implementation"""
+        if self is other:
+            return True
         if isinstance(self, other.__class__):
             return self.name == other.name
         return False
@@ -60,6 +63,32 @@ class ChemicalFeature():
         return hash(self.name)
 
 
+# Shared ChemicalFeature objects by name. See get_chemical_feature().
+_FEATURE_CACHE = {}
+
+
+def get_chemical_feature(name):
+    """Get the shared :class:`ChemicalFeature` object for ``name``.
+
+    Feature names come from a small set of values, so a single object is
+    created for each name and reused afterwards, which makes comparisons
+    between features of different atom groups cheap.
+
+    Parameters
+    ----------
+    name : str
+        The chemical feature name.
+
+    Returns
+    -------
+     : :class:`ChemicalFeature`
+    """
+    feature = _FEATURE_CACHE.get(name)
+    if feature is None:
+        feature = _FEATURE_CACHE[name] = ChemicalFeature(name)
+    return feature
+
+
 class OBMolChemicalFeature:
     """Mimic :class:`rdkit.Chem.rdMolChemicalFeatures.MolChemicalFeature`
     for Open Babel.
@@ -122,6 +151,27 @@ class FeatureExtractor:
     def __init__(self, feature_factory):
         self.feature_factory = feature_factory
 
+    @property
+    def feature_factory(self):
+        """:class:`~rdkit.Chem.rdMolChemicalFeatures.\
+MolChemicalFeatureFactory`: The RDKit feature factory."""
+        return self._feature_factory
+
+    @feature_factory.setter
+    def feature_factory(self, feature_factory):
+        self._feature_factory = feature_factory
+        # Open Babel SMARTS patterns are compiled lazily from the feature
+        # definitions and must be rebuilt whenever the factory changes.
+        self._ob_smarts_patterns = None
+
+    def _get_ob_smarts_patterns(self):
+        if self._ob_smarts_patterns is None:
+            self._ob_smarts_patterns = \
+                [(key.split(".")[0], get_smarts_pattern(str(smarts)))
+                 for key, smarts
+                 in self.feature_factory.GetFeatureDefs().items()]
+        return self._ob_smarts_patterns
+
     def get_features_by_atoms(self, mol_obj, atm_map=None):
         """Perceive chemical features from the molecule ``mol_obj`` by atom.
 
@@ -159,6 +209,8 @@ class FeatureExtractor:
 
         atm_features = defaultdict(set)
         for f in perceived_features:
+            feature = get_chemical_feature(f.GetFamily())
+
             for atm_idx in f.GetAtomIds():
                 tmp_atm_idx = atm_idx
                 if atm_map is not None:
@@ -169,7 +221,6 @@ class FeatureExtractor:
                                        "the index '%d'. It will be ignored."
                                        % atm_idx)
 
-                feature = ChemicalFeature(f.GetFamily())
                 atm_features[tmp_atm_idx].add(feature)
 
         return atm_features
@@ -215,6 +266,10 @@ class FeatureExtractor:
             logger.exception(error_msg)
             raise MoleculeObjectTypeError(error_msg)
 
+        # The features already added to each group are tracked by a set, so
+        # the list of features does not need to be rebuilt for every feature.
+        features_by_grp = {}
+
         grp_features = {}
         for f in perceived_features:
             atm_ids = sorted(list(f.GetAtomIds()))
@@ -231,26 +286,21 @@ class FeatureExtractor:
                 atm_ids = tmp_atm_ids
 
             key = ','.join([str(x) for x in atm_ids])
-            if key in grp_features:
-                grp_obj = grp_features[key]
-            else:
-                grp_obj = {"atm_ids": atm_ids, "features": []}
+            if key not in grp_features:
+                grp_features[key] = {"atm_ids": atm_ids, "features": []}
+                features_by_grp[key] = set()
 
-            features = set(grp_obj["features"])
-            feature = ChemicalFeature(f.GetFamily())
-            features.add(feature)
-            grp_obj["features"] = list(features)
-            grp_features[key] = grp_obj
+            feature = get_chemical_feature(f.GetFamily())
+
+            if feature not in features_by_grp[key]:
+                features_by_grp[key].add(feature)
+                grp_features[key]["features"].append(feature)
 
         return grp_features
 
     def _get_features_from_obmol(self, ob_mol):
         grp_features = defaultdict(set)
-        for key, smarts in self.feature_factory.GetFeatureDefs().items():
-            grp_type = key.split(".")[0]
-
-            ob_smart = OBSmartsPattern()
-            ob_smart.Init(str(smarts))
+        for grp_type, ob_smart in self._get_ob_smarts_patterns():
             ob_smart.Match(ob_mol)
 
             matches = [x for x in ob_smart.GetMapList()]
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 from luna.wrappers.base import MolWrapper
 from luna.util.default_values import MIN_FDEF_FILE
@@ -218,7 +219,7 @@ ChemicalFeatures.BuildFeatureFactory(MIN_FDEF_FILE)
         """
         try:
             if sig_factory is None:
-                sig_factory = _prepare_pharm2d_fp()["sigFactory"]
+                sig_factory = _default_sig_factory()
             return Generate.Gen2DFingerprint(self._rdmol, sig_factory)
         except Exception as e:
             logger.exception(e)
@@ -248,6 +249,19 @@ def _prepare_morgan_fp(fp_opt):
     return params
 
 
+@lru_cache(maxsize=1)
+def _default_sig_factory():
+    # Parsing the FDef file and initializing the signature factory is much
+    # more expensive than fingerprinting a molecule, so the default factory
+    # is built only once per process.
+    feat_factory = ChemicalFeatures.BuildFeatureFactory(MIN_FDEF_FILE)
+    sig_factory = SigFactory(feat_factory, minPointCount=2,
+                             maxPointCount=3, trianglePruneBins=False)
+    sig_factory.SetBins([(0, 2), (2, 5), (5, 8)])
+    sig_factory.Init()
+    return sig_factory
+
+
 def _prepare_pharm2d_fp(fp_opt=None):
     fp_opt = fp_opt or {}
 
@@ -255,18 +269,14 @@ def _prepare_pharm2d_fp(fp_opt=None):
     if "sigFactory" in fp_opt:
         sig_factory = fp_opt["sigFactory"]
     else:
-        feat_factory = ChemicalFeatures.BuildFeatureFactory(MIN_FDEF_FILE)
-        sig_factory = SigFactory(feat_factory, minPointCount=2,
-                                 maxPointCount=3, trianglePruneBins=False)
-        sig_factory.SetBins([(0, 2), (2, 5), (5, 8)])
-        sig_factory.Init()
+        sig_factory = _default_sig_factory()
 
-    params["sigFactory"] = sig_factory
+    params["sig_factory"] = sig_factory
     return params
 
 
 def _prepare_fp_params(fp_function, fp_opt):
-    if fp_function == "pharm2d_fp" and type(fp_opt) is dict:
+    if fp_function == "pharm2d_fp":
         return _prepare_pharm2d_fp(fp_opt)
     elif fp_function == "morgan_fp" and type(fp_opt) is dict:
         return _prepare_morgan_fp(fp_opt)
@@ -354,17 +364,20 @@ or :class:`~rdkit.DataStructs.cDataStructs.SparseBitVect`): the fingerprint;
                      "fingerprint type will be used: 2D Pharmacophore "
                      "fingerprint.")
 
-    logger.debug("Generating molecular fingerprints for %d molecules."
-                 % len(mols))
+    logger.debug("Generating molecular fingerprints for %d molecules.",
+                 len(mols))
 
+    # Resolve the parameters and the fingerprint function once for the
+    # whole batch instead of once per molecule.
     params = _prepare_fp_params(fp_function, fp_opt)
     fpg = FingerprintGenerator()
+    fp_func = getattr(fpg, fp_function)
 
     fp_mols = []
     for idx, mol in enumerate(mols):
         try:
             fpg.mol = mol
-            fp = getattr(fpg, fp_function)(**params)
+            fp = fp_func(**params)
             fp_mols.append({"fp": fp, "mol": mol.GetProp("_Name")})
         except Exception as e:
             logger.error("Molecule at position %d failed. Name: %s"
@@ -374,6 +387,6 @@ or :class:`~rdkit.DataStructs.cDataStructs.SparseBitVect`): the fingerprint;
             if critical:
                 raise
 
-    logger.debug("%d molecular fingerprint(s) created." % len(fp_mols))
+    logger.debug("%d molecular fingerprint(s) created.", len(fp_mols))
 
     return fp_mols
@@ -1,26 +1,27 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 from itertools import chain
 
 import numpy as np
 
 import networkx as nx
-from networkx.algorithms.shortest_paths.weighted import single_source_dijkstra
 
-from Bio.KDTree import KDTree
+from scipy.spatial import cKDTree
 
 from luna.MyBio.selector import Selector, AtomSelector
 from luna.MyBio.util import biopython_entity_to_mol
+from luna.MyBio.PDB.NeighborSearch import NeighborSearch
 from luna.interaction.contact import get_proximal_compounds
 from luna.interaction.contact import get_contacts_with
 from luna.interaction.type import InteractionType
 from luna.mol.atom import ExtendedAtom, AtomData
 from luna.mol.precomp_data import DefaultResidueData
 from luna.mol.charge_model import OpenEyeModel
-from luna.mol.features import ChemicalFeature
+from luna.mol.features import get_chemical_feature
 from luna.wrappers.base import MolWrapper
 from luna.util.exceptions import MoleculeSizeError, IllegalArgumentError
 from luna.util.default_values import COV_SEARCH_RADIUS, METAL_COMPLEX_DIST
 from luna.util import math as im
+from luna.util import DisjointSet
 from luna.util.file import pickle_data, unpickle_data
 from luna.version import __version__
 
@@ -163,12 +164,14 @@ class AtomGroupsManager():
         `AtomGroup`
             A valid `AtomGroup` object.
         """
+        types = set(types)
         for atm_grp in self.atm_grps:
+            feature_names = (f.name for f in atm_grp.features)
             if must_contain_all:
-                if set(types).issubset(set(atm_grp.feature_names)):
+                if types.issubset(feature_names):
                     yield atm_grp
             else:
-                if len(set(types) & set(atm_grp.feature_names)) > 0:
+                if not types.isdisjoint(feature_names):
                     yield atm_grp
 
     def add_atm_grps(self, atm_grps):
@@ -177,10 +180,10 @@ class AtomGroupsManager():
 
         atm_grps = atm_grps or []
 
-        self._atm_grps = list(set(self._atm_grps + list(atm_grps)))
+        self._atm_grps = list(set(self._atm_grps).union(atm_grps))
 
         for atm_grp in atm_grps:
-            self.child_dict[tuple(sorted(atm_grp.atoms))] = atm_grp
+            self.child_dict[atm_grp.key] = atm_grp
             self._compounds.update(atm_grp.compounds)
             atm_grp.manager = self
 
@@ -190,7 +193,7 @@ class AtomGroupsManager():
 
         Any recursive references to the removed objects will also be cleared.
         """
-        self._atm_grps = list(set(self._atm_grps) - set(atm_grps))
+        self._atm_grps = list(set(self._atm_grps).difference(atm_grps))
 
         for atm_grp in atm_grps:
             # ExtendedAtom objects keep a list of all AtomGroup objects to
@@ -201,9 +204,8 @@ class AtomGroupsManager():
             atm_grp.clear_refs()
 
             # Remove the atom group from the dict.
-            key = tuple(sorted(atm_grp.atoms))
-            if key in self.child_dict:
-                del self.child_dict[key]
+            if atm_grp.key in self.child_dict:
+                del self.child_dict[atm_grp.key]
 
     def new_atm_grp(self, atoms, features=None, interactions=None):
         """Create a new `AtomGroup` object for ``atoms`` if one does not exist
@@ -265,53 +267,46 @@ class AtomGroupsManager():
         # Only hydrophobic atom groups.
         hydrop_atm_grps = list(self.filter_by_types(["Hydrophobic"]))
 
-        # Hydrophobic islands dictionary. Keys are integer values and items are
-        # defined by a set of atom groups.
-        hydrop_islands = defaultdict(set)
+        # Hydrophobic atoms are defined always as only one atom.
+        hydrop_atms = [atm_grp.atoms[0] for atm_grp in hydrop_atm_grps]
+        full_ids = [atm.get_full_id() for atm in hydrop_atms]
+
+        # Covalently bonded hydrophobic atoms (represented by their full id)
+        # are merged into the same subset, i.e., the same hydrophobic island.
+        islands_ds = DisjointSet()
+        for atm, full_id in zip(hydrop_atms, full_ids):
+            islands_ds.add(full_id)
+            for nbi in atm.neighbors_info:
+                if nbi.full_id in islands_ds:
+                    islands_ds.union(full_id, nbi.full_id)
+
+        roots = [islands_ds.find(full_id) for full_id in full_ids]
+
+        # Each island is identified by the position of its last atom in
+        # 'hydrop_atm_grps'.
+        island_ids = {}
+        for i, root in enumerate(roots):
+            island_ids[root] = i
 
         # It stores a mapping of an atom (represented by its full id) and a
         # hydrophobic island (defined by its keys).
         atm_mapping = {}
 
-        island_id = 0
-        for atm_grp in hydrop_atm_grps:
-            # Hydrophobic atoms are defined always as only one atom.
-            atm = atm_grp.atoms[0]
-
-            # Recover the groups of all neighbors of this atom (it will merge
-            # all existing islands).
-            nb_grps = set([atm_mapping[nbi.full_id]
-                           for nbi in atm.neighbors_info
-                           if nbi.full_id in atm_mapping])
-
-            # Already there are hydrophobic islands formed by the neighbors of
-            # this atom.
-            if nb_grps:
-                # Merge all groups of the neighbors of this atom.
-                new_island = \
-                    set(chain.from_iterable([hydrop_islands.pop(nb_grp_id)
-                                             for nb_grp_id in nb_grps]))
-                # Include this atom to the merged group.
-                new_island.add(atm)
-
-                for k in atm_mapping:
-                    if atm_mapping[k] in nb_grps:
-                        atm_mapping[k] = island_id
-
-                hydrop_islands[island_id] = new_island
-                atm_mapping[atm.get_full_id()] = island_id
-            else:
-                atm_mapping[atm.get_full_id()] = island_id
-                hydrop_islands[island_id].add(atm)
+        # Hydrophobic islands dictionary. Keys are integer values and items are
+        # defined by a set of atom groups.
+        hydrop_islands = defaultdict(set)
+        for atm, full_id, root in zip(hydrop_atms, full_ids, roots):
+            island_id = island_ids[root]
 
-            island_id += 1
+            atm_mapping[full_id] = island_id
+            hydrop_islands[island_id].add(atm)
 
         # Create AtomGroup objects for the hydrophobic islands
-        for island_id in hydrop_islands:
+        for island_id in sorted(hydrop_islands):
             # It will update an existing atom group or create a new one
             # with the informed parameters.
             hydrophobe = self.new_atm_grp(hydrop_islands[island_id],
-                                          [ChemicalFeature("Hydrophobe")])
+                                          [get_chemical_feature("Hydrophobe")])
             # Update the island information
             hydrop_islands[island_id] = hydrophobe
 
@@ -358,23 +353,24 @@ class AtomGroupsManager():
         # Remove atom-atom hydrophobic interactions.
         interactions_mngr.remove_interactions(hydrop_interactions)
 
+        hydrop_feature = get_chemical_feature("Hydrophobic")
         for atm_grp in hydrop_atm_grps:
-            features = [f for f in atm_grp.features if f.name != "Hydrophobic"]
-
             # It may happen that a atom group ends up having no feature after
             # the remotion of the feature "Hydrophobic". This is unlikely to
             # occur as all atoms (by default) will have at least the feature
             # 'Atom'. But, depending one the pharmacophore rules definition,
             # it can occur.
-            atm_grp.features = features
+            atm_grp.remove_features([hydrop_feature])
 
     def get_shortest_path_length(self, src_grp, trgt_grp, cutoff=None):
         """Compute the shortest path length between two atom groups ``src_grp``
         and ``trgt_grp``.
 
         The shortest path between two atom groups is defined as the shortest
-        path between any of their atoms, which are calculated using Dijkstra’s
-        algorithm and the graph ``graph``.
+        path between any of their atoms. As all edges in ``graph`` have unit
+        weight, paths are calculated with a breadth-first search starting
+        from all atoms in ``src_grp`` at once, which stops as soon as any atom
+        in ``trgt_grp`` is reached.
 
         If there is not any path between ``src_grp`` and ``trgt_grp``,
         infinite is returned.
@@ -392,19 +388,25 @@ class AtomGroupsManager():
          : int or float('inf'):
             The shortest path.
         """
-        shortest_path_size = float('inf')
-        for src_atm in src_grp.atoms:
-            for trgt_atm in trgt_grp.atoms:
-                try:
-                    dist, path = single_source_dijkstra(self.graph,
-                                                        src_atm,
-                                                        trgt_atm,
-                                                        cutoff=cutoff)
-                    if dist < shortest_path_size:
-                        shortest_path_size = dist
-                except Exception:
-                    pass
-        return shortest_path_size
+        adj = self.graph.adj
+        trgt_atms = set(trgt_grp.atoms)
+
+        visited = set(a for a in src_grp.atoms if a in adj)
+        queue = deque((a, 0) for a in visited)
+        while queue:
+            atm, depth = queue.popleft()
+            if atm in trgt_atms:
+                return depth
+
+            if cutoff is not None and depth >= cutoff:
+                continue
+
+            for nb_atm in adj[atm]:
+                if nb_atm not in visited:
+                    visited.add(nb_atm)
+                    queue.append((nb_atm, depth + 1))
+
+        return float('inf')
 
     def save(self, output_file, compressed=True):
         """Write the pickled representation of the `AtomGroupsManager` object
@@ -481,10 +483,13 @@ class AtomGroup():
                  recursive=True,
                  manager=None):
         self._atoms = sorted(atoms)
+        # Atoms are already sorted, so the key is built only once and reused
+        # in hashing, comparisons, and lookups at `AtomGroupsManager`.
+        self._key = tuple(self._atoms)
 
-        # Atom properties
-        self._coords = im.atom_coordinates(atoms)
-        self._centroid = im.centroid(self.coords)
+        # Atom properties. They are computed only when first accessed.
+        self._coords = None
+        self._centroid = None
         self._normal = None
 
         features = features or []
@@ -507,6 +512,18 @@ class AtomGroup():
             The sequence of atoms that belong to an atom group."""
         return self._atoms
 
+    @property
+    def key(self):
+        """tuple of :class:`~luna.mol.atom.ExtendedAtom`, read-only: \
+            The sorted atoms of an atom group as a tuple. It is the key used \
+            to map atoms to atom groups at `AtomGroupsManager`."""
+        try:
+            return self._key
+        except AttributeError:
+            # Atom groups pickled by older versions do not store the key.
+            self._key = tuple(self._atoms)
+            return self._key
+
     @property
     def compounds(self):
         """set of :class:`~luna.MyBio.PDB.Residue.Residue`, read-only: \
@@ -521,6 +538,8 @@ class AtomGroup():
     def coords(self):
         """ array-like of floats : Atomic coordinates (x, y, z) of each \
         atom in ``atoms``."""
+        if self._coords is None:
+            self._coords = im.atom_coordinates(self._atoms)
         return self._coords
 
     @property
@@ -531,6 +550,8 @@ class AtomGroup():
         If ``atoms`` contains only one atom, then ``centroid`` returns the same
         as ``coords``.
         """
+        if self._centroid is None:
+            self._centroid = im.centroid(self.coords)
         return self._centroid
 
     @property
@@ -690,31 +711,32 @@ class AtomGroup():
     def add_features(self, features):
         """ Add :class:`~luna.mol.features.ChemicalFeature` objects
         to ``features``."""
-        self._features = sorted(set(self.features + list(features)))
+        self._features = sorted(set(self.features).union(features))
         # Reset hash.
         self._hash_cache = None
 
     def remove_features(self, features):
         """ Remove :class:`~luna.mol.features.ChemicalFeature` objects
         from ``features``."""
-        self._features = sorted(set(self.features) - set(features))
+        self._features = sorted(set(self.features).difference(features))
         # Reset hash.
         self._hash_cache = None
 
     def add_interactions(self, interactions):
         """ Add :class:`~luna.interaction.type.InteractionType` objects
         to ``interactions``."""
-        self._interactions = list(set(self.interactions + list(interactions)))
+        self._interactions = list(set(self.interactions).union(interactions))
 
     def remove_interactions(self, interactions):
         """ Remove :class:`~luna.interaction.type.InteractionType` objects
         from ``interactions``."""
-        self._interactions = list(set(self.interactions) - set(interactions))
+        self._interactions = \
+            list(set(self.interactions).difference(interactions))
 
     def is_water(self):
         """Return True if all atoms in the atom group belong to water
         molecules."""
-        return all([a.parent.is_water() for a in self.atoms])
+        return all(a.parent.is_water() for a in self.atoms)
 
     def is_hetatm(self):
         """Return True if all atoms in the atom group belong to hetero group,
@@ -723,56 +745,58 @@ class AtomGroup():
         ligands, solvent, and metal ions.
 
         Hetero groups are designated by the flag HETATM in the PDB format."""
-        return all([a.parent.is_hetatm() for a in self.atoms])
+        return all(a.parent.is_hetatm() for a in self.atoms)
 
     def is_metal(self):
         """Return True if all atoms in the atom group are metal ions."""
-        return all([a.parent.is_metal() for a in self.atoms])
+        return all(a.parent.is_metal() for a in self.atoms)
 
     def is_residue(self):
         """Return True if all atoms in the atom group belong to standard
         residues of proteins."""
-        return all([a.parent.is_residue() for a in self.atoms])
+        return all(a.parent.is_residue() for a in self.atoms)
 
     def is_nucleotide(self):
         """Return True if all atoms in the atom group belong to nucleotides."""
-        return all([a.parent.is_nucleotide() for a in self.atoms])
+        return all(a.parent.is_nucleotide() for a in self.atoms)
 
     def is_mixed(self):
         """Return True if the atoms in the atom group belong to different
         compound classes (water, hetero group, residue, or nucleotide)."""
-        return len(set([a.parent.get_class() for a in self.atoms])) > 1
+        first_class = self.atoms[0].parent.get_class()
+        return any(a.parent.get_class() != first_class
+                   for a in self.atoms[1:])
 
     def has_water(self):
         """Return True if at least one atom in the atom group belongs to a
         water molecule."""
-        return any([a.parent.is_water() for a in self.atoms])
+        return any(a.parent.is_water() for a in self.atoms)
 
     def has_hetatm(self):
         """Return True if at least one atom in the atom group belongs to a
         hetero group, i.e., non-standard residues of proteins, DNAs, or RNAs,
         as well as atoms in other kinds of groups, such as carbohydrates,
         substrates, ligands, solvent, and metal ions."""
-        return any([a.parent.is_hetatm() for a in self.atoms])
+        return any(a.parent.is_hetatm() for a in self.atoms)
 
     def has_metal(self):
         """Return True if at least one atom in the atom group is a metal."""
-        return any([a.parent.is_metal() for a in self.atoms])
+        return any(a.parent.is_metal() for a in self.atoms)
 
     def has_residue(self):
         """Return True if at least one atom in the atom group belongs to a
         standard residue of proteins."""
-        return any([a.parent.is_residue() for a in self.atoms])
+        return any(a.parent.is_residue() for a in self.atoms)
 
     def has_nucleotide(self):
         """Return True if at least one atom in the atom group belongs to a
         nucleotide."""
-        return any([a.parent.is_nucleotide() for a in self.atoms])
+        return any(a.parent.is_nucleotide() for a in self.atoms)
 
     def has_target(self):
         """Return True if at least one compound is the target of LUNA's
         analysis"""
-        return any([a.parent.is_target() for a in self.atoms])
+        return any(a.parent.is_target() for a in self.atoms)
 
     def as_json(self):
         """Represent the atom group as a dict containing the atoms, compounds,
@@ -813,6 +837,10 @@ class AtomGroup():
     def __eq__(self, other):
         """Overrides the default implementation"""
         if type(self) == type(other):
+            # Hashes are cached, so groups with different hashes are
+            # rejected without comparing their atoms and features.
+            if hash(self) != hash(other):
+                return False
             return (self.atoms == other.atoms
                     and self.features == other.features)
         return False
@@ -822,9 +850,7 @@ class AtomGroup():
         return not self.__eq__(other)
 
     def __lt__(self, other):
-        atms1 = tuple(sorted(self.atoms))
-        atms2 = tuple(sorted(other.atoms))
-        return atms1 < atms2
+        return self.key < other.key
 
     def __len__(self):
         # Number of atoms.
@@ -836,9 +862,8 @@ class AtomGroup():
             # Transform atoms and features list into an imutable data
             # structure. The lists are sorted in order to avoid
             # dependence on appending order.
-            atoms_tuple = tuple(self.atoms)
             feat_tuple = tuple(self.features)
-            self._hash_cache = hash((atoms_tuple, feat_tuple, self.__class__))
+            self._hash_cache = hash((self.key, feat_tuple, self.__class__))
         return self._hash_cache
 
 
@@ -990,6 +1015,9 @@ class AtomGroupPerceiver():
         target_compounds = set()
         # Metals are prepared separatelly.
         metals = set()
+        # KD trees built over each model's atoms. Reused by every
+        # proximal compound search in the same model.
+        nb_search_by_model = {}
 
         while comp_queue:
             comp = comp_queue.pop()
@@ -1008,7 +1036,15 @@ class AtomGroupPerceiver():
             if self.expand_selection:
                 # Remove the ligand from the list when
                 # it was provided as an OBMol object.
-                comp_list = [c for c in get_proximal_compounds(comp)
+                model = comp.get_parent_by_level('M')
+                if model not in nb_search_by_model:
+                    model_atoms = list(model.get_atoms())
+                    nb_search_by_model[model] = NeighborSearch(model_atoms)
+
+                prox_comps = \
+                    get_proximal_compounds(comp,
+                                           nb_search=nb_search_by_model[model])
+                comp_list = [c for c in prox_comps
                              if c.id not in mol_objs_dict]
 
                 for prox_comp in comp_list:
@@ -1059,7 +1095,7 @@ class AtomGroupPerceiver():
         # compound list (parameter 'compounds').
         remove_atm_grps = []
         for atm_grp in self.atm_grps_mngr:
-            if any([c in init_comps_set for c in atm_grp.compounds]) is False:
+            if any(c in init_comps_set for c in atm_grp.compounds) is False:
                 remove_atm_grps.append(atm_grp)
         self.atm_grps_mngr.remove_atm_grps(remove_atm_grps)
 
@@ -1131,41 +1167,50 @@ class AtomGroupPerceiver():
                 trgt_atms[atm_key].invariants = \
                     atm_obj.get_atomic_invariants()
 
-            # Set all neighbors, i.e., covalently bonded atoms.
+            # Set all neighbors, i.e., covalently bonded atoms. Neighbors are
+            # first collected by atom and then added to each atom at once.
+            # An AtomData object is shared by all atoms bound to the same
+            # neighbor through the same bond type, so each atom's data is
+            # created only once.
+            nb_info_by_atm = defaultdict(list)
+            atm_data_by_key = {}
             for bond_obj in mol_obj.get_bonds():
                 bgn_atm_obj = bond_obj.get_begin_atom()
                 end_atm_obj = bond_obj.get_end_atom()
 
+                bgn_atomic_num = bgn_atm_obj.get_atomic_num()
+                end_atomic_num = end_atm_obj.get_atomic_num()
+
                 # At least one of the atoms must be a non-hydrogen atom.
-                if (bgn_atm_obj.get_atomic_num() != 1
-                        or end_atm_obj.get_atomic_num() != 1):
-
-                    # If the atom 1 is not a hydrogen, add atom 2 to its
-                    # neighbor list.
-                    if bgn_atm_obj.get_atomic_num() != 1:
-                        full_id = atm_map.get(end_atm_obj.get_idx())
-                        coord = \
-                            mol_obj.get_atom_coord_by_id(end_atm_obj.get_id())
-                        atom_info = AtomData(end_atm_obj.get_atomic_num(),
-                                             coord,
-                                             bond_obj.get_bond_type(),
-                                             full_id)
+                if bgn_atomic_num == 1 and end_atomic_num == 1:
+                    continue
 
-                        bgn_atm = atm_map[bgn_atm_obj.get_idx()]
-                        trgt_atms[bgn_atm].add_nb_info([atom_info])
-
-                    # If the atom 2 is not a hydrogen, add atom 1 to its
-                    # neighbor list.
-                    if end_atm_obj.get_atomic_num() != 1:
-                        full_id = atm_map.get(bgn_atm_obj.get_idx())
-                        coord = \
-                            mol_obj.get_atom_coord_by_id(bgn_atm_obj.get_id())
-                        atom_info = AtomData(bgn_atm_obj.get_atomic_num(),
-                                             coord,
-                                             bond_obj.get_bond_type(),
+                bond_type = bond_obj.get_bond_type()
+
+                # If an atom is not a hydrogen, add its partner to its
+                # neighbor list.
+                pairs = ((bgn_atm_obj, bgn_atomic_num,
+                          end_atm_obj, end_atomic_num),
+                         (end_atm_obj, end_atomic_num,
+                          bgn_atm_obj, bgn_atomic_num))
+                for src_obj, src_atomic_num, nb_obj, nb_atomic_num in pairs:
+                    if src_atomic_num == 1:
+                        continue
+
+                    key = (nb_obj.get_idx(), bond_type)
+                    atom_info = atm_data_by_key.get(key)
+                    if atom_info is None:
+                        full_id = atm_map.get(nb_obj.get_idx())
+                        coord = mol_obj.get_atom_coord_by_id(nb_obj.get_id())
+                        atom_info = AtomData(nb_atomic_num, coord, bond_type,
                                              full_id)
-                        end_atm = atm_map[end_atm_obj.get_idx()]
-                        trgt_atms[end_atm].add_nb_info([atom_info])
+                        atm_data_by_key[key] = atom_info
+
+                    src_key = atm_map[src_obj.get_idx()]
+                    nb_info_by_atm[src_key].append(atom_info)
+
+            for atm_key, nb_info in nb_info_by_atm.items():
+                trgt_atms[atm_key].add_nb_info(nb_info)
 
             # Perceive pharmacophoric properties and create AtomGroup objects.
             group_features = \
@@ -1179,12 +1224,19 @@ class AtomGroupPerceiver():
             self._fix_pharmacophoric_rules(ob_atms_map)
 
             # Update the graph in the AtomGroupsManager object
-            # with the current network.
+            # with the current network. Each bond is found from both of its
+            # atoms, so only one direction is kept and all edges are added
+            # to the graph at once.
+            edges = []
+            added_edges = set()
             for atm in trgt_atms.values():
                 for nb_info in atm.neighbors_info:
-                    if nb_info.full_id in trgt_atms:
-                        pair = atm, trgt_atms[nb_info.full_id]
-                        self.atm_grps_mngr.graph.add_edge(*pair, weight=1)
+                    nb_atm = trgt_atms.get(nb_info.full_id)
+                    if nb_atm is None or (nb_atm, atm) in added_edges:
+                        continue
+                    added_edges.add((atm, nb_atm))
+                    edges.append((atm, nb_atm))
+            self.atm_grps_mngr.graph.add_edges_from(edges, weight=1)
 
         except Exception:
             logger.debug("Features were not correctly perceived.")
@@ -1224,7 +1276,8 @@ class AtomGroupPerceiver():
             atm.invariants = self._get_default_invariants(atm)
 
             # Define a new group and add it to 'atm_grps_mngr'.
-            feats = [ChemicalFeature("Atom"), ChemicalFeature("Metal")]
+            feats = [get_chemical_feature("Atom"),
+                     get_chemical_feature("Metal")]
             self.atm_grps_mngr.new_atm_grp([atm], feats)
 
     def _fix_pharmacophoric_rules(self, atms_map):
@@ -1239,7 +1292,7 @@ class AtomGroupPerceiver():
         for atm_grp1 in self.atm_grps_mngr:
             atoms = atm_grp1.atoms
 
-            if not any([atm.has_metal_coordination() for atm in atoms]):
+            if not any(atm.has_metal_coordination() for atm in atoms):
                 continue
 
             is_imidazole = False
@@ -1350,7 +1403,7 @@ class AtomGroupPerceiver():
         comp_names = set([c.full_name for c in compounds])
 
         for atm_grp in sorted(self.cache.atm_grps_mngr):
-            if any([c.full_name in comp_names for c in atm_grp.compounds]):
+            if any(c.full_name in comp_names for c in atm_grp.compounds):
                 atoms = []
                 for atm in atm_grp.atoms:
                     # Copy extended atom, i.e., create a new extended
@@ -1384,10 +1437,12 @@ class AtomGroupPerceiver():
             self.atm_grps_mngr.graph.add_edge(atoms[0], atoms[1], weight=1)
 
     def _new_extended_atom(self, atm, invariants=None):
-        if atm not in self.atm_mapping:
-            self.atm_mapping[atm] = ExtendedAtom(atm, invariants=invariants)
+        ext_atm = self.atm_mapping.get(atm)
+        if ext_atm is None:
+            ext_atm = ExtendedAtom(atm, invariants=invariants)
+            self.atm_mapping[atm] = ext_atm
 
-        return self.atm_mapping[atm]
+        return ext_atm
 
     def _get_atoms(self, compound):
         selector = Selector(keep_altloc=False,
@@ -1429,8 +1484,8 @@ class AtomGroupPerceiver():
 class AtomGroupNeighborhood:
     """ Class for fast neighbor atom groups searching.
 
-    ``AtomGroupNeighborhood`` makes use of a KD Tree implemented in C,
-    so it's fast.
+    ``AtomGroupNeighborhood`` makes use of a KD Tree implemented in C++
+    (:class:`scipy.spatial.cKDTree`), so it's fast.
 
     Parameters
     ----------
@@ -1447,15 +1502,13 @@ class AtomGroupNeighborhood:
     def __init__(self, atm_grps, bucket_size=10):
         self.atm_grps = list(atm_grps)
 
-        # get the coordinates
-        coord_list = [ga.centroid for ga in self.atm_grps]
-
-        # to Nx3 array of type float
-        self.coords = np.array(coord_list).astype("f")
+        # Get the centroids, which are computed once and cached by each
+        # atom group, directly as an Nx3 array of type float.
+        self.coords = np.array([ga.centroid for ga in self.atm_grps],
+                               dtype="f")
         assert(bucket_size > 1)
         assert(self.coords.shape[1] == 3)
-        self.kdt = KDTree(3, bucket_size)
-        self.kdt.set_coords(self.coords)
+        self.kdt = cKDTree(self.coords, leafsize=bucket_size)
 
     def search(self, center, radius):
         """Return all atom groups in ``atm_grps`` that is up to a maximum of
@@ -1464,12 +1517,27 @@ class AtomGroupNeighborhood:
         For atom groups with more than one atom, their centroid is used as a
         reference.
         """
-        self.kdt.search(center, radius)
-        indices = self.kdt.get_indices()
-        n_grps_list = []
+        indices = self.kdt.query_ball_point(center, radius,
+                                            return_sorted=True)
         atm_grps = self.atm_grps
-        for i in indices:
-            a = atm_grps[i]
-            n_grps_list.append(a)
+        return [atm_grps[i] for i in indices]
+
+    def search_batch(self, centers, radius):
+        """Return, for each point in ``centers``, all atom groups in
+        ``atm_grps`` that is up to a maximum of ``radius`` away
+        (measured in Å) of it.
+
+        All points are queried at once, which is faster than calling
+        :meth:`search` for each one of them.
 
-        return n_grps_list
+        Returns
+        -------
+         : list of list of `AtomGroup`
+            The atom groups found for each point, in the same order as
+            ``centers``.
+        """
+        centers = np.asarray(centers).reshape(-1, 3)
+        indices_list = self.kdt.query_ball_point(centers, radius,
+                                                 return_sorted=True)
+        atm_grps = self.atm_grps
+        return [[atm_grps[i] for i in indices] for indices in indices_list]
@@ -6,8 +6,7 @@ from Bio.PDB.Polypeptide import is_aa
 from luna.mol.precomp_data import DefaultResidueData
 from luna.wrappers.base import MolWrapper, BondType, OBBondType
 from luna.MyBio.neighbors import get_residue_neighbors
-
-from openbabel.openbabel import OBSmartsPattern
+from luna.wrappers.obabel import get_smarts_pattern
 
 import logging
 
@@ -96,6 +95,9 @@ class Standardizer:
 
         self.res_data = res_data
 
+        # Bonds of each atom by residue bond set. See _get_bonds_by_atm().
+        self._bonds_by_atm = {}
+
     def _validate_atoms_list(self, res, atom_names, precomp_data=None):
         # Current list of atoms found in this residue.
         atom_names = set(atom_names)
@@ -335,6 +337,23 @@ class Standardizer:
 
         return partner_obj, partner_atm
 
+    def _get_bonds_by_atm(self, resname, res_bonds):
+        # Map each atom name to the keys of the bonds it takes part in.
+        # As the bond keys would be split again for every atom of every
+        # residue, the map is computed only once for each residue definition.
+        # The bond keys themselves identify the definition, as residues with
+        # the same name may come from different precomputed data (or CYS may
+        # have gained a disulfide bond).
+        key = (resname, frozenset(res_bonds))
+        if key not in self._bonds_by_atm:
+            bonds_by_atm = defaultdict(set)
+            for bond_key in res_bonds:
+                for atm_name in bond_key.split(","):
+                    bonds_by_atm[atm_name].add(bond_key)
+            self._bonds_by_atm[key] = dict(bonds_by_atm)
+
+        return self._bonds_by_atm[key]
+
     def _resolve_bonds(self, resname, atm_obj, pdb_atm, precomp_data=None):
 
         precomp_data = precomp_data or self.res_data
@@ -460,8 +479,8 @@ class Standardizer:
                                           is_aromatic))
 
         # Set of expected bonds.
-        expected_bonds = set([b for b in res_bonds
-                              for an in b.split(",") if pdb_atm.name == an])
+        bonds_by_atm = self._get_bonds_by_atm(resname, res_bonds)
+        expected_bonds = bonds_by_atm.get(pdb_atm.name, set())
 
         # Set of missing bonds.
         # It ignores missing disulfide bonds as they may not exist.
@@ -760,8 +779,7 @@ class Standardizer:
 
         # In the next line, it will capture the tetrazole group that contains
         # the current atom.
-        ob_smart = OBSmartsPattern()
-        ob_smart.Init("[#6]1~[#7]~[#7]~[#7]~[#7H,#7-1]1")
+        ob_smart = get_smarts_pattern("[#6]1~[#7]~[#7]~[#7]~[#7H,#7-1]1")
         ob_smart.Match(trgt_atm_obj.parent.unwrap())
 
         atoms = []
@@ -3,9 +3,9 @@ from itertools import product
 from collections import defaultdict
 
 from rdkit.Chem import SanitizeFlags, SanitizeMol
-from openbabel.openbabel import OBSmartsPattern
 
 from luna.wrappers.base import BondType, AtomWrapper, MolWrapper
+from luna.wrappers.obabel import get_smarts_pattern
 from luna.mol.charge_model import OpenEyeModel
 import luna.util.math as lm
 
@@ -14,6 +14,20 @@ import logging
 logger = logging.getLogger()
 
 
+# Residue atoms (residue name, atom name) that belong to rings.
+IN_RING_RES_ATOMS = frozenset([('HIS', 'CD2'), ('HIS', 'CE1'), ('HIS', 'CG'),
+                               ('HIS', 'ND1'), ('HIS', 'NE2'), ('PHE', 'CD1'),
+                               ('PHE', 'CD2'), ('PHE', 'CE1'), ('PHE', 'CE2'),
+                               ('PHE', 'CG'), ('PHE', 'CZ'), ('PRO', 'CA'),
+                               ('PRO', 'CB'), ('PRO', 'CD'), ('PRO', 'CG'),
+                               ('PRO', 'N'), ('TRP', 'CD1'), ('TRP', 'CD2'),
+                               ('TRP', 'CE2'), ('TRP', 'CE3'), ('TRP', 'CG'),
+                               ('TRP', 'CH2'), ('TRP', 'CZ2'), ('TRP', 'CZ3'),
+                               ('TRP', 'NE1'), ('TYR', 'CD1'), ('TYR', 'CD2'),
+                               ('TYR', 'CE1'), ('TYR', 'CE2'), ('TYR', 'CG'),
+                               ('TYR', 'CZ')])
+
+
 class MolValidator:
     """Validate and fix molecules with the errors most commonly
     found when parsing PDB files with Open Babel.
@@ -155,8 +169,8 @@ class MolValidator:
 
                     if atm_obj.get_charge() == 1:
                         logger.debug("Atom #%d has incorrect charge. It will "
-                                     "update its charge from 1 to 0."
-                                     % atm_obj.get_idx())
+                                     "update its charge from 1 to 0.",
+                                     atm_obj.get_idx())
 
                         atm_obj.set_charge(0)
                         self._remove_explicit_hydrogens(atm_obj)
@@ -173,8 +187,8 @@ class MolValidator:
 
                         logger.debug("Atom #%d has incorrect charge. It will "
                                      "update its charge from 1 to 0 and fix "
-                                     "its number of bound hydrogens."
-                                     % atm_obj.get_idx())
+                                     "its number of bound hydrogens.",
+                                     atm_obj.get_idx())
 
                         # Set residue charge to 0.
                         atm_obj.set_charge(0)
@@ -213,9 +227,8 @@ class MolValidator:
                     self._remove_explicit_hydrogens(atm_obj)
 
     def _fix_nitro_substructure_and_charge(self, mol_obj):
-        ob_smart = OBSmartsPattern()
         # Invalid nitro pattern.
-        ob_smart.Init("[$([NX3v5]([!#8])(=O)=O)]")
+        ob_smart = get_smarts_pattern("[$([NX3v5]([!#8])(=O)=O)]")
         if ob_smart.Match(mol_obj.unwrap()):
             logger.debug("One or more invalid nitro substructures "
                          "('*-N(=O)=O') were found. It will try to "
@@ -224,7 +237,7 @@ class MolValidator:
             # Iterate over each Nitro group in the molecule.
             for ids in ob_smart.GetUMapList():
                 # Get the N atom.
-                atm_obj = [AtomWrapper(mol_obj.GetAtom(i)) for i in ids][0]
+                atm_obj = AtomWrapper(mol_obj.GetAtom(ids[0]), mol_obj)
                 for bond in atm_obj.get_bonds():
                     partner = bond.get_partner_atom(atm_obj)
 
@@ -240,9 +253,8 @@ class MolValidator:
                         # It needs to update only one of the oxygen bonds.
                         break
 
-            ob_smart = OBSmartsPattern()
             # Valid nitro pattern.
-            ob_smart.Init("[$([NX3v4+](=O)[O-])][!#8]")
+            ob_smart = get_smarts_pattern("[$([NX3v4+](=O)[O-])][!#8]")
             if ob_smart.Match(mol_obj.unwrap()):
                 logger.debug("Invalid nitro substructures ('*-N(=O)=O') "
                              "successfully substituted to '*-[N+]([O-])=O'.")
@@ -255,9 +267,8 @@ class MolValidator:
         # with a +0 charge. To fix it, we assign the correct charges to
         # the N (+1) and C (0).
 
-        ob_smart = OBSmartsPattern()
         # Invalid amidine and guanidine pattern.
-        ob_smart.Init("[$([NH1X2v3+0](=[CH0X3+1](N)))]")
+        ob_smart = get_smarts_pattern("[$([NH1X2v3+0](=[CH0X3+1](N)))]")
         if ob_smart.Match(mol_obj.unwrap()):
             logger.debug("One or more amidine/guanidine substructures with no "
                          "charge were found. It will try to attribute a +1 "
@@ -267,7 +278,7 @@ class MolValidator:
             # Iterate over each Amidine/Guanidine group in the molecule.
             for ids in ob_smart.GetUMapList():
                 # Get the N atom.
-                atm_obj = [AtomWrapper(mol_obj.GetAtom(i)) for i in ids][0]
+                atm_obj = AtomWrapper(mol_obj.GetAtom(ids[0]), mol_obj)
 
                 for bond in atm_obj.get_bonds():
                     partner = bond.get_partner_atom(atm_obj)
@@ -289,9 +300,8 @@ class MolValidator:
                         # Remove any charges in the C.
                         partner.set_charge(0)
 
-            ob_smart = OBSmartsPattern()
             # Valid amidine and guanidine pattern.
-            ob_smart.Init("[$([NH2X3v4+1](=[CH0X3+0](N)))]")
+            ob_smart = get_smarts_pattern("[$([NH2X3v4+1](=[CH0X3+0](N)))]")
             if ob_smart.Match(mol_obj.unwrap()):
                 logger.debug("Invalid amidine/guanidine substructures were "
                              "correctly charged.")
@@ -304,32 +314,20 @@ class MolValidator:
         if pdb_atm is None:
             return True
 
-        in_ring = set([('HIS', 'CD2'), ('HIS', 'CE1'), ('HIS', 'CG'),
-                       ('HIS', 'ND1'), ('HIS', 'NE2'), ('PHE', 'CD1'),
-                       ('PHE', 'CD2'), ('PHE', 'CE1'), ('PHE', 'CE2'),
-                       ('PHE', 'CG'), ('PHE', 'CZ'), ('PRO', 'CA'),
-                       ('PRO', 'CB'), ('PRO', 'CD'), ('PRO', 'CG'),
-                       ('PRO', 'N'), ('TRP', 'CD1'), ('TRP', 'CD2'),
-                       ('TRP', 'CE2'), ('TRP', 'CE3'), ('TRP', 'CG'),
-                       ('TRP', 'CH2'), ('TRP', 'CZ2'), ('TRP', 'CZ3'),
-                       ('TRP', 'NE1'), ('TYR', 'CD1'), ('TYR', 'CD2'),
-                       ('TYR', 'CE1'), ('TYR', 'CE2'), ('TYR', 'CG'),
-                       ('TYR', 'CZ')])
-
         key = (pdb_atm.parent.resname, pdb_atm.name)
 
         # If Open Babel perceives the current atom as belonging to a ring,
         #   why it shouldn't, try to fix it.
         if (pdb_atm.parent.is_residue() and atm_obj.is_in_ring()
-                and key not in in_ring):
+                and key not in IN_RING_RES_ATOMS):
 
             logger.debug("Atom #%d has been incorrectly perceived as part of "
-                         "a ring." % atm_obj.get_idx())
+                         "a ring.", atm_obj.get_idx())
 
             if self.fix_in_ring:
                 logger.debug("'Fix in ring' option is set on. It will "
-                             "set the atom #%d as not part of a ring."
-                             % atm_obj.get_idx())
+                             "set the atom #%d as not part of a ring.",
+                             atm_obj.get_idx())
 
                 atm_obj.set_in_ring(False)
 
@@ -344,6 +342,8 @@ class MolValidator:
         # Currently, atoms other than N are not evaluated as no valence error
         # has been identified for them.
         if atm_obj.get_atomic_num() == 7:
+            valence = atm_obj.get_valence()
+            charge = atm_obj.get_charge()
 
             # Molecules containing quaternary ammonium N.
             #
@@ -355,15 +355,15 @@ class MolValidator:
             #    - Solution: set the number of implicit Hs to 0 and set the
             #                charge to +1.
             #
-            if atm_obj.get_valence() == 5 and atm_obj.get_charge() == 0:
-                logger.debug("Atom #%d has incorrect valence and charge."
-                             % atm_obj.get_idx())
+            if valence == 5 and charge == 0:
+                logger.debug("Atom #%d has incorrect valence and charge.",
+                             atm_obj.get_idx())
 
                 if self.fix_valence:
                     logger.debug("'Fix valence' option is set on. It will "
                                  "update the valence of atom #%d from %d "
-                                 "to 4 and correct its charge."
-                                 % (atm_obj.get_idx(), atm_obj.get_valence()))
+                                 "to 4 and correct its charge.",
+                                 atm_obj.get_idx(), valence)
 
                     # Fix the number of implicit Hs and charge.
                     atm_obj.unwrap().SetImplicitHCount(0)
@@ -381,18 +381,18 @@ class MolValidator:
             #
             #    - Solution: remove the H and its bond with the N.
             #
-            elif (atm_obj.get_valence() == 5 and atm_obj.get_charge() == 1
+            elif (valence == 5 and charge == 1
                     and atm_obj.get_h_count() == 1):
 
                 logger.debug("Atom #%d has incorrect valence and number of "
-                             "hydrogens." % atm_obj.get_idx())
+                             "hydrogens.", atm_obj.get_idx())
 
                 if self.fix_valence:
                     logger.debug("'Fix valence' option is set on. It will "
                                  "update the valence of atom #%d from %d "
                                  "to 4 and correct the number of hydrogens "
-                                 "bound to it."
-                                 % (atm_obj.get_idx(), atm_obj.get_valence()))
+                                 "bound to it.",
+                                 atm_obj.get_idx(), valence)
 
                     self._remove_explicit_hydrogens(atm_obj)
 
@@ -406,7 +406,7 @@ class MolValidator:
             elif atm_obj.matches_smarts("[$([#7;X4H2+1](C)C=O)]"):
 
                 logger.debug("Atom #%d has incorrect valence, charge, and "
-                             "number of hydrogens." % atm_obj.get_idx())
+                             "number of hydrogens.", atm_obj.get_idx())
 
                 if not self.fix_valence:
                     return False
@@ -472,8 +472,8 @@ class MolValidator:
                 logger.debug("'Fix valence' option is set on. It will "
                              "update the valence of atom #%d from %d "
                              "to 3 and correct its charge and the number "
-                             "of hydrogens bound to it."
-                             % (atm_obj.get_idx(), atm_obj.get_valence()))
+                             "of hydrogens bound to it.",
+                             atm_obj.get_idx(), atm_obj.get_valence())
 
                 ob_mol = atm_obj.parent.unwrap()
                 ob_mol.DeleteAtom(H_to_remove[0].unwrap())
@@ -487,29 +487,23 @@ class MolValidator:
         if not isinstance(atm_obj, AtomWrapper):
             atm_obj = AtomWrapper(atm_obj)
 
-        expected_charge = self._get_expected_charge(atm_obj)
+        expected_charge = self.charge_model.get_charge(atm_obj)
 
         if (expected_charge is not None
                 and expected_charge != atm_obj.get_charge()):
-            logger.debug("Atom #%d has incorrect charges defined."
-                         % atm_obj.get_idx())
+            logger.debug("Atom #%d has incorrect charges defined.",
+                         atm_obj.get_idx())
 
             if self.fix_charges:
                 logger.debug("'Fix charges' option is set on. It will update "
-                             "the charge of atom #%d from %d to %d."
-                             % (atm_obj.get_idx(), atm_obj.get_charge(),
-                                expected_charge))
+                             "the charge of atom #%d from %d to %d.",
+                             atm_obj.get_idx(), atm_obj.get_charge(),
+                             expected_charge)
                 atm_obj.set_charge(expected_charge)
                 return True
             return False
         return True
 
-    def _get_expected_charge(self, atm_obj):
-        if not isinstance(atm_obj, AtomWrapper):
-            atm_obj = AtomWrapper(atm_obj)
-
-        return self.charge_model.get_charge(atm_obj)
-
     def _remove_explicit_hydrogens(self, atm_obj):
         if not isinstance(atm_obj, AtomWrapper):
             atm_obj = AtomWrapper(atm_obj)
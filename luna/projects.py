@@ -3,12 +3,12 @@ import time
 import logging
 import glob
 import warnings
-import itertools
+from functools import lru_cache
 import networkx as nx
 import multiprocessing as mp
-from scipy.special import comb
 
 # Open Babel and RDKit libraries
+from rdkit import DataStructs
 from rdkit.Chem import ChemicalFeatures
 from rdkit.Chem import MolFromSmiles
 
@@ -31,7 +31,7 @@ from luna.util.logging import (new_logging_file, load_default_logging_config,
                                VERBOSITY_LEVEL)
 from luna.util.multiprocessing_logging import (start_mp_handler,
                                                MultiProcessingHandler)
-from luna.util.jobs import ArgsGenerator, ParallelJobs
+from luna.util.jobs import ParallelJobs, OUTPUT_BUFFER_SIZE
 
 from luna.MyBio.PDB.PDBParser import PDBParser
 from luna.MyBio.PDB.FTMapParser import FTMapParser
@@ -48,6 +48,14 @@ logger = load_default_logging_config()
 MAX_NPROCS = mp.cpu_count() - 1
 
 
+@lru_cache(maxsize=None)
+def _get_feature_extractor(atom_prop_file):
+    # RDKit feature factories cannot be pickled, so they are built once per
+    # process and FDef file instead of being stored in the project.
+    feature_factory = ChemicalFeatures.BuildFeatureFactory(atom_prop_file)
+    return FeatureExtractor(feature_factory)
+
+
 class StructureCache:
 
     def __init__(self, compounds, atm_grps_mngr):
@@ -584,12 +592,11 @@ class Project:
         except Exception as e:
             self._log("exception", e)
 
-    def _log(self, level, message):
+    def _log(self, level, message, *args):
+        # Like the logging module, ``message`` is only formatted with
+        # ``args`` if a record is actually emitted for ``level``.
         if self.logging_enabled:
-            try:
-                getattr(logger, level)(message)
-            except Exception:
-                raise
+            getattr(logger, level)(message, *args)
 
     def _log_preferences(self):
         self._log("debug", "New project initialized...")
@@ -669,13 +676,13 @@ class Project:
         """Search and remove duplicate entries from ``entries``."""
         entries = {}
         for entry in self.entries:
-            if entry.to_string() not in entries:
-                entries[entry.to_string()] = entry
+            entry_id = entry.to_string()
+            if entry_id not in entries:
+                entries[entry_id] = entry
             else:
                 self._log("debug", "An entry with id '%s' already exists in "
                           "the list of entries, so the entry %s is a "
-                          "duplicate and will be removed."
-                          % (entry.to_string(), entry))
+                          "duplicate and will be removed.", entry_id, entry)
 
         self._log("info", "The remotion of duplicate entries was finished. "
                   "%d entrie(s) were removed."
@@ -691,14 +698,12 @@ class Project:
         """Verify if a local PDB file exists for each entry in ``entries``.
             If it does not find a given PDB file, then LUNA will try to
             download it from RCSB."""
-        all_pdb_ids = set()
-        to_download = set()
-        for entry in self.entries:
-            pdb_file = "%s/%s.pdb" % (self.pdb_path, entry.pdb_id)
-            if not exists(pdb_file):
-                to_download.add(entry.pdb_id)
-
-            all_pdb_ids.add(entry.pdb_id)
+        # Entries often share the same PDB (e.g., docked ligands), so the
+        # file system is checked only once for each unique PDB id.
+        all_pdb_ids = set([entry.pdb_id for entry in self.entries])
+        to_download = set([pdb_id for pdb_id in all_pdb_ids
+                           if not exists("%s/%s.pdb" % (self.pdb_path,
+                                                        pdb_id))])
 
         logger.info("%d PDB file(s) found at '%s' from a total of %d PDB(s). "
                     "So, %d PDB(s) need to be downloaded."
@@ -730,7 +735,7 @@ class Project:
                 if method.upper() in NMR_METHODS:
                     self._log("debug", "The structure related to the entry "
                               "'%s' was obtained by NMR, so it will "
-                              "not add hydrogens to it." % entry.to_string())
+                              "not add hydrogens to it.", entry.to_string())
                     return False
             return True
         return False
@@ -768,9 +773,7 @@ class Project:
         return pdb_parser, structure, ligand
 
     def _get_perceiver(self, add_h, cache=None):
-        feats_factory_func = ChemicalFeatures.BuildFeatureFactory
-        feature_factory = feats_factory_func(self.atom_prop_file)
-        feature_extractor = FeatureExtractor(feature_factory)
+        feature_extractor = _get_feature_extractor(self.atom_prop_file)
 
         perceiver = AtomGroupPerceiver(feature_extractor, add_h=add_h,
                                        ph=self.ph, amend_mol=self.amend_mol,
@@ -807,8 +810,8 @@ class Project:
         # Remove any edges involving the ligand.
         valid_edges = set()
         for edge in atm_grps_mngr.graph.edges:
-            if any([atm.parent.is_hetatm() or atm.parent.is_metal()
-                    for atm in edge]) is False:
+            if any(atm.parent.is_hetatm() or atm.parent.is_metal()
+                   for atm in edge) is False:
                 valid_edges.add(edge)
         atm_grps_mngr.graph = nx.Graph()
         atm_grps_mngr.graph.add_edges_from(valid_edges)
@@ -838,8 +841,9 @@ class Project:
 
     def _perceive_chemical_groups(self, entry, entity, ligand,
                                   add_h=False, cache=None):
+        entry_id = entry.to_string()
         self._log("debug", "Starting pharmacophore perception "
-                  "for entry '%s'" % entry.to_string())
+                  "for entry '%s'", entry_id)
 
         inter_config = self.inter_calc.inter_config
         radius = inter_config.get("bsite_cutoff",
@@ -861,7 +865,7 @@ class Project:
                                            mol_objs_dict=mol_objs_dict)
 
         self._log("debug", "Pharmacophore perception for entry '%s' has "
-                  "finished." % entry.to_string())
+                  "finished.", entry_id)
 
         return atm_grps_mngr
 
@@ -874,8 +878,8 @@ class Project:
         else:
             # TODO: implement support for other entries.
             self._log("warning", "Currently, it cannot generate molecular "
-                      "fingerprints for instances of %s."
-                      % entry.__class__.__name__)
+                      "fingerprints for instances of %s.",
+                      entry.__class__.__name__)
 
     def _create_ifp(self, atm_grps_mngr):
         sg = ShellGenerator(self.ifp_num_levels, self.ifp_radius_step,
@@ -888,34 +892,45 @@ class Project:
                                  unique_shells=unique_shells,
                                  count_fp=self.ifp_count)
 
-    def _create_ifp_file(self):
+    def _iter_fps(self, fp_attr, fps_by_entry=None):
+        # Fingerprints sent back by the workers are used directly. Only
+        # entries without them (e.g., skipped in append mode) have their
+        # pickled results reloaded from disk.
+        fps_by_entry = fps_by_entry or {}
+        for entry in self.entries:
+            fps = fps_by_entry.get(entry.to_string())
+            if fps is not None and fp_attr in fps:
+                yield entry, fps[fp_attr]
+            else:
+                results = self.get_entry_results(entry)
+                if results:
+                    yield entry, getattr(results, fp_attr)
+
+    def _create_ifp_file(self, fps_by_entry=None):
         ifp_output = self.ifp_output or ("%s/results/fingerprints/ifp.csv"
                                          % self.working_path)
-        with open(ifp_output, "w") as OUT:
+        with open(ifp_output, "w", buffering=OUTPUT_BUFFER_SIZE) as OUT:
             if self.ifp_count:
                 OUT.write("ligand_id,on_bits,count\n")
             else:
                 OUT.write("ligand_id,on_bits\n")
 
-            for entry, ifp in self.ifps:
+            for entry, ifp in self._iter_fps("ifp", fps_by_entry):
                 if self.ifp_count:
-                    fp_bits_str = "\t".join([str(idx)
-                                             for idx in ifp.counts.keys()])
-                    fp_count_str = "\t".join([str(count) for count
-                                              in ifp.counts.values()])
+                    fp_bits_str = "\t".join(map(str, ifp.counts.keys()))
+                    fp_count_str = "\t".join(map(str, ifp.counts.values()))
                     OUT.write("%s,%s,%s\n" % (entry.to_string(), fp_bits_str,
                                               fp_count_str))
                 else:
-                    fp_bits_str = "\t".join([str(x) for x
-                                             in ifp.get_on_bits()])
+                    fp_bits_str = "\t".join(map(str, ifp.get_on_bits()))
                     OUT.write("%s,%s\n" % (entry.to_string(), fp_bits_str))
 
-    def _create_mfp_file(self):
+    def _create_mfp_file(self, fps_by_entry=None):
         mfp_output = (self.mfp_output or "%s/results/fingerprints/mfp.csv"
                       % self.working_path)
-        with open(mfp_output, "w") as OUT:
+        with open(mfp_output, "w", buffering=OUTPUT_BUFFER_SIZE) as OUT:
             OUT.write("ligand_id,on_bits\n")
-            for entry, mfp in self.mfps:
+            for entry, mfp in self._iter_fps("mfp", fps_by_entry):
                 try:
                     bits = mfp.GetOnBits()
                 except Exception:
@@ -926,23 +941,28 @@ class Project:
                                      "for entry '%s'." % entry.to_string())
                         raise InvalidFingerprintType(error_msg)
 
-                fp_str = "\t".join([str(x) for x in bits])
+                fp_str = "\t".join(map(str, bits))
                 OUT.write("%s,%s\n" % (entry.to_string(), fp_str))
 
-    def _calc_similarity(self, res1, res2):
-        return "%s,%s,%s" % (res1.entry.to_string(),
-                             res2.entry.to_string(),
-                             str(res1.ifp.calc_similarity(res2.ifp)))
-
-    def _generate_similarity_matrix(self, output_file):
-        nargs = int(comb(len(self.entries), 2))
-        args = ArgsGenerator(itertools.combinations(self.results, 2), nargs)
-
-        header = "entry1,entry2,similarity"
-        pj = ParallelJobs(self.nproc)
-        return pj.run_jobs(args=args, consumer_func=self._calc_similarity,
-                           output_file=output_file, output_header=header,
-                           job_name="Calculate similarities")
+    def _generate_similarity_matrix(self, output_file, fps_by_entry=None):
+        # Each IFP is converted to an RDKit fingerprint only once and the
+        # Tanimoto similarities of each row are computed in bulk by RDKit.
+        entries = []
+        rdkit_fps = []
+        for entry, ifp in self._iter_fps("ifp", fps_by_entry):
+            if ifp is None:
+                continue
+            entries.append(entry.to_string())
+            rdkit_fps.append(ifp.to_rdkit())
+
+        with open(output_file, "w") as OUT:
+            OUT.write("entry1,entry2,similarity\n")
+
+            for i in range(len(rdkit_fps) - 1):
+                sims = DataStructs.BulkTanimotoSimilarity(rdkit_fps[i],
+                                                          rdkit_fps[i + 1:])
+                for entry, sim in zip(entries[i + 1:], sims):
+                    OUT.write("%s,%s,%s\n" % (entries[i], entry, str(sim)))
 
     def run(self):
         """Run LUNA. However, this method is not implemented by default.
@@ -1126,9 +1146,9 @@ InteractionFilter.new_pli_filter())
     def _process_entry(self, entry):
 
         start = time.time()
+        entry_id = entry.to_string()
 
-        self._log("debug", "Starting entry processing: %s."
-                  % entry.to_string())
+        self._log("debug", "Starting entry processing: %s.", entry_id)
 
         try:
             # Check if the entry is in the correct format.
@@ -1138,12 +1158,11 @@ InteractionFilter.new_pli_filter())
 
             # Entry results will be saved here.
             pkl_file = "%s/chunks/%s.pkl.gz" % (self.working_path,
-                                                entry.to_string())
+                                                entry_id)
             if self.append_mode and exists(pkl_file):
                 self._log("debug", "Since append mode is set ON, it will "
                           "skip entry '%s' because a result for this entry "
-                          " already exists in the working path."
-                          % entry.to_string())
+                          " already exists in the working path.", entry_id)
                 return
 
             pdb_parser, structure, ligand = self._parse_complex(entry)
@@ -1190,7 +1209,7 @@ InteractionFilter.new_pli_filter())
 
             # Saving interactions to CSV file.
             csv_file = ("%s/results/interactions/%s.csv"
-                        % (self.working_path, entry.to_string()))
+                        % (self.working_path, entry_id))
             interactions_mngr.to_csv(csv_file)
 
             # Saving interactions into a Pymol session.
@@ -1198,37 +1217,38 @@ InteractionFilter.new_pli_filter())
                 from luna.interaction.view import InteractionViewer
                 pse_path = (self.pse_path
                             or "%s/results/pse/" % self.working_path)
-                pse_file = "%s/%s.pse" % (pse_path, entry.to_string())
+                pse_file = "%s/%s.pse" % (pse_path, entry_id)
                 piv = InteractionViewer(add_directional_arrows=True)
                 piv.new_session([(entry, interactions_mngr,
                                   entry.pdb_file)], pse_file)
 
             self._log("debug",
-                      "Processing of entry '%s' finished successfully."
-                      % entry.to_string())
+                      "Processing of entry '%s' finished successfully.",
+                      entry_id)
 
         except Exception:
             self._log("debug",
                       "Processing of entry '%s' failed. "
-                      "Check the logs for more information."
-                      % entry.to_string())
+                      "Check the logs for more information.", entry_id)
             raise
 
         proc_time = time.time() - start
         self._log("debug",
-                  "Processing of entry '%s' took %.2fs."
-                  % (entry.to_string(), proc_time))
+                  "Processing of entry '%s' took %.2fs.",
+                  entry_id, proc_time)
+
+        return {"ifp": ifp, "mfp": mfp}
 
     def _process_ifps(self, entry):
         start = time.time()
+        entry_id = entry.to_string()
 
         self._log("debug",
-                  "Starting IFP processing for entry '%s'."
-                  % entry.to_string())
+                  "Starting IFP processing for entry '%s'.", entry_id)
 
         try:
             pkl_file = ("%s/chunks/%s.pkl.gz"
-                        % (self.working_path, entry.to_string()))
+                        % (self.working_path, entry_id))
 
             if exists(pkl_file):
                 # Reload results.
@@ -1244,29 +1264,31 @@ InteractionFilter.new_pli_filter())
             else:
                 error_msg = ("The IFP of the entry '%s' could not be "
                              "generated because its pickled data file "
-                             "'%s' was not found." % (entry.to_string(),
+                             "'%s' was not found." % (entry_id,
                                                       pkl_file))
                 raise FileNotFoundError(error_msg)
 
         except Exception:
             self._log("debug", "IFP processing for entry '%s' failed. Check "
-                      "the logs for more information." % entry.to_string())
+                      "the logs for more information.", entry_id)
             raise
 
         proc_time = time.time() - start
-        self._log("debug", "IFP processing for entry '%s' took %.2fs." %
-                  (entry.to_string(), proc_time))
+        self._log("debug", "IFP processing for entry '%s' took %.2fs.",
+                  entry_id, proc_time)
+
+        return {"ifp": ifp}
 
     def _process_mfps(self, entry):
         start = time.time()
+        entry_id = entry.to_string()
 
         self._log("debug",
-                  "Starting MFP processing for entry '%s'."
-                  % entry.to_string())
+                  "Starting MFP processing for entry '%s'.", entry_id)
 
         try:
             pkl_file = ("%s/chunks/%s.pkl.gz"
-                        % (self.working_path, entry.to_string()))
+                        % (self.working_path, entry_id))
 
             if exists(pkl_file):
                 # Reload results.
@@ -1281,18 +1303,20 @@ InteractionFilter.new_pli_filter())
             else:
                 error_msg = ("The MFP of the entry '%s' could not be "
                              "generated because its pickled data file "
-                             "'%s' was not found." % (entry.to_string(),
+                             "'%s' was not found." % (entry_id,
                                                       pkl_file))
                 raise FileNotFoundError(error_msg)
 
         except Exception:
             self._log("debug", "MFP processing for entry '%s' failed. Check "
-                      "the logs for more information." % entry.to_string())
+                      "the logs for more information.", entry_id)
             raise
 
         proc_time = time.time() - start
-        self._log("debug", "MFP processing for entry '%s' took %.2fs." %
-                  (entry.to_string(), proc_time))
+        self._log("debug", "MFP processing for entry '%s' took %.2fs.",
+                  entry_id, proc_time)
+
+        return {"mfp": mfp}
 
     def __call__(self):
 
@@ -1338,6 +1362,10 @@ InteractionFilter.new_pli_filter())
                                   job_name="Entries processing")
         self.errors = job_results.errors
 
+        # Fingerprints returned by the workers for each processed entry.
+        fps_by_entry = {e.to_string(): fps
+                        for e, fps in job_results.outputs if fps is not None}
+
         # Remove failed entries.
         if self.errors:
             entries_with_error = set([e[0].to_string() for e in self.errors])
@@ -1362,14 +1390,15 @@ InteractionFilter.new_pli_filter())
 
             # Generate IFP/MFP files
             if self.calc_ifp:
-                self._create_ifp_file()
+                self._create_ifp_file(fps_by_entry)
             if self.calc_mfp:
-                self._create_mfp_file()
+                self._create_mfp_file(fps_by_entry)
 
             if self.ifp_sim_matrix_output and len(self.entries) > 1:
                 self._log("info", "Calculating the Tanimoto similarity "
                           "between fingerprints.")
-                self._generate_similarity_matrix(self.ifp_sim_matrix_output)
+                self._generate_similarity_matrix(self.ifp_sim_matrix_output,
+                                                 fps_by_entry)
 
         # Save the whole project information.
         self.save(self.project_file)
@@ -1485,7 +1514,10 @@ InteractionFilter.new_pli_filter())
                               % ", ".join([e for e in entries_with_error]))
 
                 # Create an output file by calling the provided function.
-                file_func()
+                fps_by_entry = {e.to_string(): fps
+                                for e, fps in job_results.outputs
+                                if fps is not None}
+                file_func(fps_by_entry)
 
             return success, errors
 
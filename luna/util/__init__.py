@@ -99,6 +99,93 @@ def iter_to_chunks(l, n):
     return [l[i:i + n] for i in range(0, len(l), n)]
 
 
+class DisjointSet:
+    """Disjoint-set (union-find) data structure with path compression and
+    union by size.
+
+    Parameters
+    ----------
+    elements : iterable, optional
+        A sequence of hashable elements. Each element starts in its own
+        subset.
+
+    Examples
+    --------
+
+    >>> from luna.util import DisjointSet
+    >>> ds = DisjointSet(["a", "b", "c"])
+    >>> ds.union("a", "b")
+    True
+    >>> ds.find("a") == ds.find("b")
+    True
+    >>> ds.find("a") == ds.find("c")
+    False
+    """
+
+    def __init__(self, elements=None):
+        self._parents = {}
+        self._sizes = {}
+
+        for x in elements or []:
+            self.add(x)
+
+    def __contains__(self, x):
+        return x in self._parents
+
+    def __len__(self):
+        return len(self._parents)
+
+    def add(self, x):
+        """Add the element ``x`` as a new subset if it does not exist yet."""
+        if x not in self._parents:
+            self._parents[x] = x
+            self._sizes[x] = 1
+
+    def find(self, x):
+        """Return the representative element of the subset containing ``x``.
+
+        Raises
+        ------
+        KeyError
+            If ``x`` is not in the disjoint set.
+        """
+        parents = self._parents
+
+        root = x
+        while parents[root] != root:
+            root = parents[root]
+
+        # Path compression.
+        while parents[x] != root:
+            parents[x], x = root, parents[x]
+
+        return root
+
+    def union(self, x, y):
+        """Merge the subsets containing ``x`` and ``y``.
+
+        Returns
+        -------
+         : bool
+            True if two different subsets were merged, False if ``x`` and
+            ``y`` already were in the same subset.
+        """
+        x_root = self.find(x)
+        y_root = self.find(y)
+
+        if x_root == y_root:
+            return False
+
+        # Union by size: the smaller tree is attached to the larger one.
+        if self._sizes[x_root] < self._sizes[y_root]:
+            x_root, y_root = y_root, x_root
+
+        self._parents[y_root] = x_root
+        self._sizes[x_root] += self._sizes.pop(y_root)
+
+        return True
+
+
 class LUNAWarning(Warning):
     """Base LUNA warning class.
 
@@ -329,7 +329,7 @@ def validate_file(path):
     validate_filesystem(path, "file")
 
 
-def pickle_data(data, output_file, compressed=True):
+def pickle_data(data, output_file, compressed=True, compresslevel=6):
     """Write the pickled representation of the object ``data`` to
     the file ``output_file``.
 
@@ -342,6 +342,10 @@ def pickle_data(data, output_file, compressed=True):
     compressed : bool, optional
         If True (the default), compress the pickled representation as
         a gzip file (.gz).
+    compresslevel : int, optional
+        The gzip compression level, from 1 (fastest) to 9 (smallest).
+        The default value is 6, which compresses pickled objects about
+        twice as fast as level 9 with nearly the same file size.
 
     Raises
     -------
@@ -349,13 +353,15 @@ def pickle_data(data, output_file, compressed=True):
         If the file could not be created.
     """
     open_func = open
+    open_kwargs = {}
     if compressed:
         open_func = gzip.open
+        open_kwargs["compresslevel"] = compresslevel
         if output_file.endswith(".gz") is False:
             output_file += ".gz"
 
     try:
-        with open_func(output_file, "wb") as OUT:
+        with open_func(output_file, "wb", **open_kwargs) as OUT:
             pickle.dump(data, OUT, pickle.HIGHEST_PROTOCOL)
     except OSError as e:
         raise FileNotCreated("File '%s' could not be created."
@@ -11,6 +11,9 @@ logger = logging.getLogger()
 
 MAX_NPROCS = mp.cpu_count() - 1
 
+# Buffer size (in bytes) used to write the outputs of a job.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
 
 class Sentinel:
     """Custom sentinel to stop workers"""
@@ -127,12 +130,13 @@ class ParallelJobs:
             if output is not None and output_queue is not None:
                 output_queue.put((data, output))
 
-            # Update progress tracker.
+            # Update progress tracker. The executed function is not sent
+            # back, as pickling a bound method pickles its whole instance
+            # (e.g., a Project) for every task.
             pd = ProgressData(input_data=data,
                               output_data=output,
                               exception=exception,
-                              proc_time=proc_time,
-                              func=func)
+                              proc_time=proc_time)
             progress_queue.put(pd)
 
             job_queue.task_done()
@@ -140,7 +144,9 @@ class ParallelJobs:
     def _saver(self, output_queue, output_file,
                proc_func=None, output_header=None):
 
-        with open(output_file, "w") as OUT:
+        # Outputs are buffered and only flushed when the file is closed,
+        # which avoids one write syscall per task on large jobs.
+        with open(output_file, "w", buffering=OUTPUT_BUFFER_SIZE) as OUT:
             if output_header is not None:
                 OUT.write(output_header.strip())
                 OUT.write("\n")
@@ -165,9 +171,7 @@ class ParallelJobs:
                     if line is None:
                         line = data[1]
 
-                    OUT.write(str(line).strip())
-                    OUT.write("\n")
-                    OUT.flush()
+                    OUT.write("%s\n" % str(line).strip())
                 except Exception as e:
                     logger.error("An error occurred while trying to save "
                                  "the output '%s'." % str(line))
@@ -234,8 +238,9 @@ class ParallelJobs:
             logger.warning("The output file '%s' was defined. So, it will "
                            "try to save results at it." % output_file)
 
-        # Queue for progress tracker.
-        progress_queue = mp.JoinableQueue(maxsize=1)
+        # Queue for progress tracker. It is unbounded so that consumers do
+        # not stall after each task until the progress bar catches up.
+        progress_queue = mp.JoinableQueue()
 
         # Progress tracker
         self.progress_tracker = ProgressTracker(len(args), progress_queue,
@@ -282,6 +287,9 @@ class ParallelJobs:
                 output_queue.join()
                 output_queue.put(sentinel)
 
+                # Wait for the writer to close (and flush) the output file.
+                o.join()
+
         else:
             self._sequential(args, consumer_func, progress_queue)
 
@@ -1,7 +1,7 @@
 import numpy as np
 import scipy.optimize
+import scipy.linalg
 import functools
-from scipy.spatial import distance
 
 
 def atom_coordinates(atoms):
@@ -13,10 +13,10 @@ def ob_atom_coordinates(ob_atoms):
 
 
 def axis_sum(arr, decimals=3):
-    values = [0] * arr.shape[1]
-    for i in range(0, arr.shape[1]):
-        values[i] = np.around(np.sum(arr[:, i]), decimals)
-    return np.array(values)
+    # Sum all columns in a single call. Columns are made contiguous so
+    # that each one is summed in the same order as a 1-D array.
+    arr = np.ascontiguousarray(np.asarray(arr).T)
+    return np.around(np.sum(arr, axis=1), decimals)
 
 
 def point_in_line(p1, p2, d):
@@ -34,7 +34,12 @@ def centroid(arr, decimals=3):
 
 
 def euclidean_distance(p1, p2, decimals=3):
-    return round(distance.euclidean(p1, p2), decimals)
+    # Called for every pair of atoms/atom groups tested during interaction
+    # calculation, so it skips the input validation done by SciPy's
+    # distance.euclidean(). The norm is computed as in distance.euclidean()
+    # (i.e., by scipy.linalg.norm) so that rounded distances are identical.
+    return round(scipy.linalg.norm(np.subtract(p1, p2), check_finite=False),
+                 decimals)
 
 
 def angle(p1, p2, decimals=3):
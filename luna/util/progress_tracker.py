@@ -1,6 +1,7 @@
 # Source: http://www.codekoala.com/posts/command-line-progress-bar-python/
 
 from threading import Thread, Event
+from queue import Empty
 
 import time
 import sys
@@ -187,22 +188,18 @@ class ProgressTracker:
         """Updates a progress bar on stdout anytime progress is made"""
 
         while True:
-            while not q.full():
-                # Stops the loop if function end() is called before the queue
-                # gets full.
-                if e.is_set():
+            try:
+                # Block until more progress is made. Workers never wait for
+                # the progress bar to consume their data.
+                progress_data = q.get(timeout=0.1)
+            except Empty:
+                # If our event is set and all tasks were reported, break out
+                # of the infinite loop and prepare to terminate this thread.
+                # An empty queue is not enough, as workers' feeder threads
+                # may still be flushing data after the jobs were joined.
+                if e.is_set() and self.progress >= self.ntasks:
                     break
-                # wait for more progress to be made
-                time.sleep(0.1)
-
-            # If our event is set and there is any progress in the queue,
-            # break out of the infinite loop and prepare to terminate this
-            # thread
-            if e.is_set() and q.full() is False:
-                break
-
-            # get the current progress data.
-            progress_data = q.get()
+                continue
 
             if progress_data is not None:
                 self.results.append(progress_data)
@@ -12,6 +12,7 @@ from openbabel.pybel import Molecule as PybelMol
 from openbabel.pybel import readstring, readfile
 
 from luna.wrappers.rdkit import new_mol_from_block, read_mol_from_file
+from luna.wrappers.obabel import get_smarts_pattern
 from luna.util.math import euclidean_distance
 from luna.util.exceptions import (AtomObjectTypeError, BondObjectTypeError,
                                   IllegalArgumentError, MoleculeObjectError,
@@ -409,8 +410,8 @@ class AtomWrapper:
             If the informed bond type is not an instance of `BondType`.
         """
         if isinstance(bond_type, BondType):
-            return any([bond_obj.get_bond_type() == bond_type
-                        for bond_obj in self.get_bonds()])
+            return any(bond_obj.get_bond_type() == bond_type
+                       for bond_obj in self.get_bonds())
         else:
             msg = ("The informed bond type must be an instance of '%s'."
                    % BondType)
@@ -429,8 +430,8 @@ class AtomWrapper:
             If the informed bond type is not an instance of `BondType`.
         """
         if isinstance(bond_type, BondType):
-            return all([bond_obj.get_bond_type() == bond_type
-                        for bond_obj in self.get_bonds()])
+            return all(bond_obj.get_bond_type() == bond_type
+                       for bond_obj in self.get_bonds())
         else:
             msg = ("The informed bond type must be an instance of '%s'."
                    % BondType)
@@ -529,8 +530,7 @@ class AtomWrapper:
             raise NotImplementedError(error_msg)
 
         elif self.is_openbabel_obj():
-            ob_smart = ob.OBSmartsPattern()
-            ob_smart.Init(smarts)
+            ob_smart = get_smarts_pattern(smarts)
 
             if ob_smart.Match(self.parent):
                 for match in ob_smart.GetMapList():
@@ -1,5 +1,7 @@
 from subprocess import Popen, PIPE, TimeoutExpired
+from functools import lru_cache
 
+from openbabel.openbabel import OBSmartsPattern
 from openbabel.pybel import informats, outformats
 
 from luna.util.exceptions import (FileNotCreated, InvalidFileFormat,
@@ -11,6 +13,29 @@ import logging
 logger = logging.getLogger()
 
 
+@lru_cache(maxsize=None)
+def get_smarts_pattern(smarts):
+    """Get an Open Babel SMARTS pattern compiled from ``smarts``.
+
+    Each SMARTS is compiled only once and the same pattern object is
+    returned afterwards. As Open Babel stores the results of the last
+    match in the pattern, read them (e.g., with ``GetMapList()``) before
+    matching the same SMARTS again.
+
+    Parameters
+    ----------
+    smarts : str
+        A SMARTS string.
+
+    Returns
+    -------
+     : :class:`openbabel.openbabel.OBSmartsPattern`
+    """
+    ob_smart = OBSmartsPattern()
+    ob_smart.Init(smarts)
+    return ob_smart
+
+
 def _prep_opts(opts, prefix=""):
     opt_list = []
     if opts is not None:
@@ -81,14 +106,15 @@ def mol_to_svg(infile, output, opts=None):
 
 def convert_molecule(mol_input, input_format=None,
                      output_file=None, output_format=None,
-                     opts=None, openbabel=OPENBABEL):
+                     opts=None, openbabel=OPENBABEL, is_block=False):
     """Convert a molecular file to another format using Open Babel.
 
     Parameters
     ----------
 
     mol_input : str
-        The pathname of a molecular file or a SMILES string.
+        The pathname of a molecular file, a SMILES string, or a molecular
+        string block (e.g., a PDB or MOL block) if ``is_block`` is True.
     input_format : str, optional
         The molecular format of ``mol_input``.
         If not provided, the format will be defined by the file ``mol_input``
@@ -109,6 +135,10 @@ def convert_molecule(mol_input, input_format=None,
     openbabel : str, optional
         The Open Babel binary location.
         If not provided, the default binary ('obabel') will be used.
+    is_block : bool
+        If True, ``mol_input`` is a molecular string block, which is passed
+        to Open Babel through its standard input. In this case,
+        ``input_format`` is required. The default value is False.
 
 
     Returns
@@ -121,6 +151,8 @@ def convert_molecule(mol_input, input_format=None,
     ------
     InvalidFileFormat
         If the provided molecular formats are not accepted by Open Babel.
+    OSError
+        If ``mol_input`` is neither a block, a SMILES, nor an existing file.
 
     Examples
     --------
@@ -136,24 +168,32 @@ ZINC000007786517.mol",
     ...                  output_file="example.mol2",
     ...                  opts={"p": 7})
     """
-    logger.info("Molecule or file '%s' will be converted to format '%s'."
-                % (mol_input, input_format))
-
-    if is_file_valid(mol_input):
-        if input_format is None:
-            msg = ("Input file format not defined. "
-                   "It will assume the format from the file extension.")
-            logger.debug(msg)
-            input_format = get_file_format(mol_input)
+    if is_block:
+        logger.info("Molecular block will be converted to format '%s'."
+                    % output_format)
 
         if input_format not in informats:
             msg = "Input format '%s' does not exist." % input_format
             raise InvalidFileFormat(msg)
 
-        logger.debug("Input format: %s" % input_format)
-
     else:
-        if input_format != "smi":
+        logger.info("Molecule or file '%s' will be converted to format '%s'."
+                    % (mol_input, input_format))
+
+        if is_file_valid(mol_input):
+            if input_format is None:
+                msg = ("Input file format not defined. "
+                       "It will assume the format from the file extension.")
+                logger.debug(msg)
+                input_format = get_file_format(mol_input)
+
+            if input_format not in informats:
+                msg = "Input format '%s' does not exist." % input_format
+                raise InvalidFileFormat(msg)
+
+            logger.debug("Input format: %s", input_format)
+
+        elif input_format != "smi":
             msg = ("File '%s' does not exist or is not a valid file."
                    % mol_input)
             raise OSError(msg)
@@ -169,7 +209,7 @@ ZINC000007786517.mol",
             msg = "Output format '%s' does not exist." % output_format
             raise InvalidFileFormat(msg)
 
-        logger.debug("Output format: %s" % output_format)
+        logger.debug("Output format: %s", output_format)
 
     elif output_file is not None:
         msg = "The 'output_file' should be a string or None."
@@ -179,7 +219,12 @@ ZINC000007786517.mol",
         msg = "The output format could not be identified."
         raise IllegalArgumentError(msg)
 
-    if input_format == "smi":
+    # Molecular blocks are read from the standard input.
+    stdin_data = None
+    if is_block:
+        input_list = ['-i', input_format]
+        stdin_data = mol_input.encode()
+    elif input_format == "smi":
         input_list = [f'-:{mol_input}']
     else:
         input_list = ['-i', input_format, mol_input]
@@ -198,9 +243,9 @@ ZINC000007786517.mol",
     opt_list = _prep_opts(opts)
     args = [openbabel] + input_list + output_list + opt_list
 
-    p = Popen(args, stdout=PIPE, stderr=PIPE)
+    p = Popen(args, stdin=PIPE, stdout=PIPE, stderr=PIPE)
     try:
-        stdout, stderr = p.communicate(timeout=timeout)
+        stdout, stderr = p.communicate(input=stdin_data, timeout=timeout)
     except TimeoutExpired:
         p.kill()
         raise
@@ -211,6 +256,8 @@ ZINC000007786517.mol",
         raise ProcessingFailed("The provided molecule could not be converted.")
 
     if output_file is None:
-        return stdout.decode().strip()
+        # Only trailing whitespaces are removed as formats like MOL may
+        # start with an empty title line.
+        return stdout.decode().rstrip()
 
-    logger.debug("File '%s' created with success." % output_file)
+    logger.debug("File '%s' created with success.", output_file)
@@ -1,6 +1,6 @@
 from rdkit.Chem import (MolFromMol2File, MolFromPDBFile, MolFromMolFile,
-                        MolFromMolBlock, MolFromMol2Block, SanitizeFlags,
-                        SanitizeMol)
+                        MolFromMolBlock, MolFromMol2Block, MolFromPDBBlock,
+                        SanitizeFlags, SanitizeMol)
 from xopen import xopen
 
 from luna.util.file import get_file_format
@@ -8,6 +8,7 @@ from luna.util.exceptions import IllegalArgumentError
 
 import re
 import logging
+from io import TextIOWrapper
 
 logger = logging.getLogger()
 
@@ -120,6 +121,10 @@ def new_mol_from_block(block, mol_format, sanitize=True, removeHs=True):
         # First it creates the molecule without applying the
         # sanitization function.
         rdk_mol = MolFromMol2Block(block, sanitize=False, removeHs=removeHs)
+    elif mol_format == "pdb":
+        # First it creates the molecule without applying the
+        # sanitization function.
+        rdk_mol = MolFromPDBBlock(block, sanitize=False, removeHs=removeHs)
     elif mol_format in RDKIT_FORMATS:
         # First it creates the molecule without applying the
         # sanitization function.
@@ -145,7 +150,8 @@ def read_multimol_file(mol_file,
                        targets=None,
                        mol_format=None,
                        sanitize=True,
-                       removeHs=True):
+                       removeHs=True,
+                       offset=0):
     """Read molecules from a multimolecular file using RDKit.
 
     Parameters
@@ -161,6 +167,9 @@ def read_multimol_file(mol_file,
         If True (the default), sanitize the molecule.
     removeHs : bool
         If True (the default), remove explict hydrogens from the molecule.
+    offset : int, optional
+        Start reading ``mol_file`` from this position (in bytes), which
+        must be the beginning of a molecule block. The default value is 0.
 
     Yields
     -------
@@ -243,7 +252,14 @@ inputs/ligands.mol2",
                                    "are: %s."
                                    % (ext, ",".join(RDKIT_FORMATS)))
 
-    with xopen(mol_file, "r") as IN:
+    with xopen(mol_file, "rb" if offset else "r") as IN:
+        if offset:
+            # Byte offsets are only valid on binary streams, so the file is
+            # decoded after seeking. It is decoded as the molecule ids in
+            # the multimolecular file indices (luna.mol.entry).
+            IN.seek(offset)
+            IN = TextIOWrapper(IN, encoding="utf-8", errors="replace")
+
         if targets is not None:
             targets = set(targets)
 
@@ -1,11 +1,13 @@
 import unittest
 
 import sys
-from os.path import dirname, abspath
+import tempfile
+from os.path import dirname, abspath, getmtime
 
 sys.path.append(dirname(dirname(abspath(__file__))))
 
 from luna.mol.entry import *
+from luna.mol.entry import _index_multimol_file, _read_mol_block
 from luna.util.exceptions import InvalidEntry, IllegalArgumentError, MoleculeObjectError, MoleculeObjectTypeError, MoleculeNotFoundError
 
 
@@ -185,5 +187,67 @@ class EntryTest(unittest.TestCase):
         self.assertEqual(entry.get_biopython_key(), ("W", 104, " "))
 
 
+class MultimolFileIndexTest(unittest.TestCase):
+
+    def _new_blocks(self, mol_format):
+        from rdkit.Chem import MolFromSmiles, MolToMolBlock
+        from openbabel.pybel import readstring
+
+        # The second and fourth titles are UTF-8 and Latin-1 encoded,
+        # respectively. The first id is duplicated by the third molecule.
+        titles = [b"lig1", "lig2 \u00e9".encode(), b"lig1", b"lig4 \xe9"]
+        blocks = []
+        for i, title in enumerate(titles):
+            smiles = "C" * (i + 1) + "O"
+            if mol_format == "mol2":
+                block = readstring("smi", smiles).write("mol2")
+                lines = block.split("\n")
+                lines[1] = "TITLE"
+                block = "\n".join(lines)
+            else:
+                block = MolToMolBlock(MolFromSmiles(smiles))
+                block = "TITLE" + block[block.index("\n"):] + "$$$$\n"
+            blocks.append(block.encode().replace(b"TITLE", title, 1))
+        return blocks
+
+    def _check_file(self, mol_format):
+        blocks = self._new_blocks(mol_format)
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            mol_file = "%s/mols.%s" % (tmp_path, mol_format)
+            with open(mol_file, "wb") as OUT:
+                OUT.write(b"".join(blocks))
+
+            offsets = [sum(len(b) for b in blocks[:i])
+                       for i in range(len(blocks))]
+
+            index = _index_multimol_file(mol_file, mol_format,
+                                         getmtime(mol_file))
+
+            # Only the first occurrence of a duplicated id is kept.
+            self.assertEqual({"lig1": offsets[0],
+                              "lig2 \u00e9": offsets[1],
+                              "lig4 \ufffd": offsets[3]}, index)
+
+            for i in [0, 1, 3]:
+                block = _read_mol_block(mol_file, mol_format, offsets[i])
+                self.assertEqual(blocks[i].decode(errors="replace"), block)
+
+            # Molecules with non UTF-8 titles are loaded by their decoded id.
+            for mol_obj_type in ["rdkit", "openbabel"]:
+                entry = MolFileEntry.from_mol_file("protein", "lig4 \ufffd",
+                                                   mol_file=mol_file,
+                                                   is_multimol_file=True,
+                                                   mol_obj_type=mol_obj_type,
+                                                   autoload=True)
+                self.assertEqual(5, entry.mol_obj.get_num_heavy_atoms())
+
+    def test_sdf_file(self):
+        self._check_file("sdf")
+
+    def test_mol2_file(self):
+        self._check_file("mol2")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -12,8 +12,10 @@ from luna.mol.entry import *
 from luna.interaction.filter import InteractionFilter
 from luna.interaction.calc import InteractionCalculator
 from luna.interaction.fp.shell import ShellGenerator
+from luna.interaction.fp.fingerprint import Fingerprint
 from luna.interaction.fp.type import IFPType
-from luna.util.file import create_directory, remove_files
+from luna.util.file import (create_directory, remove_files, pickle_data,
+                             unpickle_data)
 from luna.util.default_values import LUNA_PATH
 from luna.version import __version__ as version
 
@@ -185,6 +187,113 @@ class FingerprintTest(unittest.TestCase):
                                                ifp_radius_step=1)
         self.assertNotEqual(expected_results["ifps"][idx], ifp_as_str)
 
+    def test_atm_grps_pickle_roundtrip(self):
+
+        pli_obj = self._get_project_results()
+
+        pkl_file = "%s/tmp/atm_grps_mngr.pkl.gz" % project_path
+        create_directory("%s/tmp" % project_path)
+
+        for r in pli_obj.results:
+            pickle_data(r.atm_grps_mngr, pkl_file)
+            atm_grps_mngr = unpickle_data(pkl_file)
+
+            self.assertEqual(len(r.atm_grps_mngr), len(atm_grps_mngr))
+            self.assertEqual(len(r.atm_grps_mngr.child_dict),
+                             len(atm_grps_mngr.child_dict))
+
+            # Atom groups must still be reachable by their atoms.
+            for atm_grp in atm_grps_mngr:
+                self.assertIs(atm_grps_mngr.find_atm_grp(atm_grp.atoms),
+                              atm_grp)
+
+            self.assertEqual(self._generate_manual_ifp(r.atm_grps_mngr),
+                             self._generate_manual_ifp(atm_grps_mngr))
+
+        remove_files([pkl_file])
+
+    def test_hydrophobic_islands(self):
+        from luna.util import math as im
+
+        pli_obj = self._get_project_results()
+
+        for r in pli_obj.results:
+            inters = list(r.interactions_mngr.filter_by_types(["Hydrophobic"]))
+            self.assertTrue(len(inters) > 0)
+
+            island_pairs = set()
+            for inter in inters:
+                # Atom-atom interactions must have been merged into
+                # island-island interactions.
+                for atm_grp, atms in [(inter.src_grp,
+                                       inter.src_interacting_atms),
+                                      (inter.trgt_grp,
+                                       inter.trgt_interacting_atms)]:
+                    self.assertIn("Hydrophobe",
+                                  [f.name for f in atm_grp.features])
+                    self.assertTrue(set(atms) <= set(atm_grp.atoms))
+
+                key = frozenset([inter.src_grp, inter.trgt_grp])
+                self.assertNotIn(key, island_pairs)
+                island_pairs.add(key)
+
+                # Distances are computed between the centroids of the
+                # interacting atoms of each island.
+                centroid1 = im.centroid(
+                    im.atom_coordinates(inter.src_interacting_atms))
+                centroid2 = im.centroid(
+                    im.atom_coordinates(inter.trgt_interacting_atms))
+                self.assertEqual(im.euclidean_distance(centroid1, centroid2),
+                                 inter.params["dist_hydrop_inter"])
+
+            # No atom group keeps the atom-level 'Hydrophobic' feature.
+            for atm_grp in r.atm_grps_mngr:
+                self.assertNotIn("Hydrophobic",
+                                 [f.name for f in atm_grp.features])
+
+    def test_mol_fingerprints(self):
+        from rdkit.Chem import MolFromSmiles
+        from luna.mol.fingerprint import (generate_fp_for_mols,
+                                          FingerprintGenerator)
+
+        mols = []
+        for smiles in ["N[C@@H](CCC(N)=O)C(O)=O", "C[C@@H](C(=O)O)N"]:
+            mol = MolFromSmiles(smiles)
+            mol.SetProp("_Name", smiles)
+            mols.append(mol)
+
+        fpg = FingerprintGenerator()
+        fpg.mol = mols[0]
+        expected_fp = fpg.pharm2d_fp()
+
+        # The default parameters must be accepted by 'pharm2d_fp'.
+        fps = generate_fp_for_mols(mols, "pharm2d_fp", critical=True)
+        self.assertEqual(len(mols), len(fps))
+        self.assertEqual(mols[0].GetProp("_Name"), fps[0]["mol"])
+        self.assertEqual(expected_fp, fps[0]["fp"])
+
+        fps = generate_fp_for_mols(mols, "morgan_fp",
+                                   fp_opt={"length": 1024}, critical=True)
+        self.assertEqual(len(mols), len(fps))
+
+    def test_fingerprint_similarity(self):
+        from rdkit import DataStructs
+
+        fp1 = Fingerprint.from_bit_string("0010101110000010")
+        fp2 = Fingerprint.from_bit_string("1010100110010010")
+        self.assertEqual(fp1.calc_similarity(fp2), 0.625)
+        self.assertEqual(fp1.calc_similarity(fp1), 1.0)
+
+        # Empty fingerprints have no similarity, as in RDKit.
+        empty_fp = Fingerprint.from_indices([], fp_length=16)
+        self.assertEqual(empty_fp.calc_similarity(empty_fp), 0.0)
+
+        fp1 = Fingerprint.from_indices([1, 5, 10, 3000], fp_length=4096)
+        fp2 = Fingerprint.from_indices([1, 10, 2048, 3001], fp_length=4096)
+        self.assertEqual(fp1.calc_similarity(fp2),
+                         DataStructs.FingerprintSimilarity(fp1.to_rdkit(),
+                                                           fp2.to_rdkit()))
+
 
 if __name__ == '__main__':
     unittest.main()
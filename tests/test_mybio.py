@@ -8,6 +8,11 @@ sys.path.append(dirname(dirname(abspath(__file__))))
 from luna.MyBio.PDB.Model import Model
 from luna.MyBio.PDB.Chain import Chain
 from luna.MyBio.extractor import Extractor
+from luna.MyBio.PDB.PDBParser import PDBParser
+from luna.MyBio.util import biopython_entity_to_mol
+from luna.wrappers.obabel import convert_molecule
+from luna.mol.standardiser import Standardizer
+from luna.util.default_values import LUNA_PATH
 
 
 class ExtractorTest(unittest.TestCase):
@@ -45,5 +50,47 @@ class ExtractorTest(unittest.TestCase):
         self.assertNotEqual(extractor.entity.id, 1)
 
 
+class EntityToMolTest(unittest.TestCase):
+
+    def test_convert_block(self):
+        mol_block = convert_molecule("CCO", input_format="smi",
+                                     output_format="mol")
+        smiles = convert_molecule(mol_block, input_format="mol",
+                                  output_format="can", is_block=True)
+        self.assertEqual("CCO", smiles.split()[0])
+
+        # Without 'is_block', the input must be an existing file.
+        self.assertRaises(OSError, convert_molecule, mol_block,
+                          input_format="mol", output_format="can")
+
+    def test_biopython_entity_to_mol(self):
+        pdb_file = f"{LUNA_PATH}/example/inputs/protein.pdb"
+        pdb_parser = PDBParser(PERMISSIVE=True, QUIET=True)
+        structure = pdb_parser.get_structure("protein", pdb_file)
+        residue = next(structure[0].get_residues())
+
+        for amend_mol in [False, True]:
+            mol_obj, ignored_atoms = \
+                biopython_entity_to_mol(residue, amend_mol=amend_mol)
+            self.assertEqual(len(list(residue.get_atoms())),
+                             mol_obj.get_num_heavy_atoms())
+            self.assertEqual([], ignored_atoms)
+
+
+class StandardizerTest(unittest.TestCase):
+
+    def test_bonds_by_atm(self):
+        std = Standardizer()
+
+        bonds_by_atm = std._get_bonds_by_atm("ALA", {"N,CA": {}, "CA,C": {}})
+        self.assertEqual({"N": {"N,CA"}, "CA": {"N,CA", "CA,C"},
+                          "C": {"CA,C"}}, bonds_by_atm)
+
+        # Same residue name and number of bonds, but different bonds.
+        bonds_by_atm = std._get_bonds_by_atm("ALA", {"N,CA": {}, "CA,CB": {}})
+        self.assertEqual({"N": {"N,CA"}, "CA": {"N,CA", "CA,CB"},
+                          "CB": {"CA,CB"}}, bonds_by_atm)
+
+
 if __name__ == '__main__':
     unittest.main()
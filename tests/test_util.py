@@ -2,10 +2,14 @@ import unittest
 
 import sys
 from os.path import dirname, abspath
+from queue import Queue
+from threading import Timer
 
 sys.path.append(dirname(dirname(abspath(__file__))))
 
 from luna.util.progress_tracker import *
+from luna.util import DisjointSet
+from luna.util.math import euclidean_distance
 
 
 class ProgressResultTest(unittest.TestCase):
@@ -77,5 +81,67 @@ class ProgressResultTest(unittest.TestCase):
         self.assertNotEqual(pr.outputs, [(1, "a")])
 
 
+class ProgressTrackerTest(unittest.TestCase):
+
+    def test_late_progress(self):
+        queue = Queue()
+        pt = ProgressTracker(3, queue)
+        pt.start()
+
+        # Progress data arriving after end() is called must not be lost.
+        def put_data():
+            for i in range(3):
+                queue.put(ProgressData(i, 0.1, output_data=i * 2))
+        Timer(0.3, put_data).start()
+
+        pt.end()
+        self.assertEqual(3, pt.progress)
+        self.assertEqual([(0, 0), (1, 2), (2, 4)], pt.results.outputs)
+
+
+class DisjointSetTest(unittest.TestCase):
+
+    def test_union_find(self):
+        ds = DisjointSet(range(6))
+        self.assertEqual(len(ds), 6)
+        self.assertTrue(3 in ds)
+        self.assertFalse(6 in ds)
+
+        # Every element starts in its own subset.
+        self.assertEqual(len(set([ds.find(x) for x in range(6)])), 6)
+
+        self.assertTrue(ds.union(0, 1))
+        self.assertTrue(ds.union(2, 3))
+        self.assertTrue(ds.union(1, 3))
+        # Elements already in the same subset.
+        self.assertFalse(ds.union(0, 2))
+
+        self.assertEqual(ds.find(0), ds.find(3))
+        self.assertNotEqual(ds.find(0), ds.find(4))
+        self.assertNotEqual(ds.find(4), ds.find(5))
+
+        ds.add(6)
+        self.assertEqual(ds.find(6), 6)
+
+        # Unknown element.
+        self.assertRaises(KeyError, ds.find, 7)
+
+
+class MathTest(unittest.TestCase):
+
+    def test_euclidean_distance(self):
+        import numpy as np
+        from scipy.spatial import distance
+
+        # Rounded distances must match SciPy's on float32 coordinates, as
+        # interaction cutoffs are tested against them.
+        rng = np.random.RandomState(0)
+        coords1 = (rng.rand(20000, 3) * 60 - 30).astype(np.float32)
+        coords2 = (rng.rand(20000, 3) * 60 - 30).astype(np.float32)
+        for p1, p2 in zip(coords1, coords2):
+            self.assertEqual(round(distance.euclidean(p1, p2), 3),
+                             euclidean_distance(p1, p2))
+
+
 if __name__ == '__main__':
     unittest.main()